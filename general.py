@@ -6,9 +6,15 @@ import time
 import re
 import math
 import uuid
-
-from collections import defaultdict
-from flask import Flask, Response, jsonify, request, url_for, redirect, render_template, flash, get_flashed_messages, send_from_directory, render_template_string, session
+import secrets
+import heapq
+
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice, zip_longest
+from operator import attrgetter, itemgetter
+from flask import Flask, Response, g, has_app_context, jsonify, request, url_for, redirect, render_template, flash, get_flashed_messages, send_from_directory, render_template_string, session
 from markupsafe import Markup, escape
 from urllib.parse import quote, unquote
 from datetime import datetime, timezone, timedelta
@@ -21,15 +27,53 @@ from typing import Optional, Dict, Any, List
 load_dotenv()
 oai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
-def safe_date(x):
+def _parse_iso_utc(value):
     try:
-        dt = datetime.fromisoformat(x[2])
+        dt = datetime.fromisoformat(value)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt
     except Exception:
         return datetime.min.replace(tzinfo=timezone.utc)
 
+def safe_date(x):
+    return _parse_iso_utc(x[2])
+
+# Precompiled patterns shared by the slug/token helpers
+_SLUG_RE = re.compile(r"[^a-z0-9_]+")
+_SLUG_PATH_RE = re.compile(r"[^a-z0-9/_-]+")  # allow _, -, /
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+_TOK_RE = re.compile(r"[^a-z0-9_ ]+")
+_SEARCH_TOK_RE = re.compile(r"\w+")  # Unicode-aware words for the global search index
+_NON_WORD_CHAR_RE = re.compile(r"\W")
+
+# steps of the general wizard (general_iframe_wizard ?step=)
+_WIZARD_STEPS = frozenset({"start", "time", "labels", "events", "review"})
+
+# Shared fallback for missing "properties" blocks: read-only sentinel; never mutate
+_EMPTY: dict = {}
+
+def _slugify_type_name(s: str) -> str:
+    return _SLUG_RE.sub("_", (s or "").lower()).strip("_") or "untitled"
+
+@lru_cache(maxsize=4096)
+def _humanize(key: str) -> str:
+    """"life_stage" -> "Life Stage"; keys come from a small, bounded vocabulary."""
+    return key.replace("_", " ").title()
+
+@lru_cache(maxsize=256)
+def _compiled_pattern(patt: str):
+    """re.compile for user-supplied (label input) patterns; raises re.error like re.compile."""
+    return re.compile(patt)
+
+def _parse_conf(raw, default: int = 100) -> int:
+    """Form confidence value as an int in 0..100; blank, malformed or out-of-range gives `default`."""
+    try:
+        v = int(raw)
+    except (TypeError, ValueError):
+        return default
+    return v if 0 <= v <= 100 else default
+
 try:
     from zoneinfo import ZoneInfo  # type: ignore[import]  # Python 3.9+
 except ImportError:
@@ -38,6 +82,7 @@ from utils import (
     load_grouped_biographies,
     load_json_as_dict,
     save_dict_as_json,
+    save_dict_as_json_later,
     get_readable_time,
     printButton,
     prettify,
@@ -76,7 +121,18 @@ from utils import (
     build_label_catalog_for_type,
     resolve_property_options as _utils_resolve_property_options,
     _resolve_property_file,
-    _sibling_image
+    image_urls,
+    json_loads,
+    write_json_atomic,
+    _pending_json,
+    dumps_json_bytes,
+    cached_listdir,
+    cached_scandir,
+    load_json_cached,
+    bump_cache_generation,
+    open_in_folder,
+    forget_ensured_dirs,
+    cache_generation
 )
 
 from time_utils import normalise_time_for_bio_entry
@@ -93,6 +149,8 @@ from llm_utils import (
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.getenv('FLASK_SECRET_KEY', 'the_random_string')  # Use environment variable if available
+# Behind Apache (mod_xsendfile) or lighttpd, let the front server stream /types/* and the favicon
+app.config['USE_X_SENDFILE'] = os.getenv('USE_X_SENDFILE', '').lower() in ('1', 'true', 'yes')
 
 app.jinja_env.filters['uk_datetime'] = uk_datetime
 app.jinja_env.filters['display_dob_uk'] = display_dob_uk
@@ -104,6 +162,26 @@ app.jinja_env.filters['display_dob_uk'] = display_dob_uk
 def inject_utilities():
     return dict(get_icon=get_icon)
 
+
+@lru_cache(maxsize=None)
+def _hot_template(name: str):
+    return app.jinja_env.get_template(name)
+
+
+def _render_hot(template_name: str, /, **context) -> str:
+    """
+    render_template for the busiest pages: the compiled template is held here
+    rather than re-resolved through the loader each request. Context processors
+    (get_icon, request, session...) still run; the template_rendered signal is
+    skipped. With auto-reload on (debug) it falls back to the normal lookup.
+    """
+    if app.jinja_env.auto_reload:
+        tpl = app.jinja_env.get_template(template_name)
+    else:
+        tpl = _hot_template(template_name)
+    app.update_template_context(context)
+    return tpl.render(context)
+
 @app.route('/favicon.ico')
 def favicon():
     return send_from_directory(
@@ -122,7 +200,7 @@ def _list_event_groups() -> list:
             continue
         data = load_json_as_dict(os.path.join(base, fn)) or {}
         key = data.get("key") or os.path.splitext(fn)[0]
-        label = data.get("label") or key.replace("_", " ").title()
+        label = data.get("label") or _humanize(key)
         out.append({
             "key": key,
             "label": label,
@@ -150,7 +228,7 @@ def _load_time_kinds_and_options():
 
         key = os.path.splitext(fn)[0]  # e.g. "life_stage", "date", "range"
         data = load_json_as_dict(os.path.join(base, fn)) or {}
-        desc = (data.get("description") or data.get("label") or key.replace("_", " ").title()).strip()
+        desc = (data.get("description") or data.get("label") or _humanize(key)).strip()
 
         has_folder = os.path.isdir(os.path.join(base, key))
         time_kinds.append({"key": key, "desc": desc, "has_folder": has_folder})
@@ -163,7 +241,7 @@ def _load_time_kinds_and_options():
                     continue
                 item = load_json_as_dict(os.path.join(folder, cf)) or {}
                 oid  = (item.get("id") or os.path.splitext(cf)[0]).strip()
-                disp = (item.get("display") or item.get("label") or oid.replace("_"," ").title()).strip()
+                disp = (item.get("display") or item.get("label") or _humanize(oid)).strip()
                 if oid:
                     opts.append({"id": oid, "display": disp})
             options_by_key[key] = opts
@@ -231,96 +309,180 @@ def serve_type_files(filename):
 
 def _copytree_safe(src: str, dst: str):
     """Copy a directory tree into an existing (or new) destination, without blowing up if files exist."""
-    os.makedirs(dst, exist_ok=True)
+    tgt_dirs = {dst}
+    copies = []
     for root, dirs, files in os.walk(src):
         rel = os.path.relpath(root, src)
         tgt = os.path.join(dst, rel) if rel != "." else dst
-        os.makedirs(tgt, exist_ok=True)
-        for d in dirs:
-            os.makedirs(os.path.join(tgt, d), exist_ok=True)
-        for f in files:
-            s = os.path.join(root, f)
-            t = os.path.join(tgt, f)
-            if not os.path.exists(t):
-                shutil.copy2(s, t)
+        tgt_dirs.add(tgt)
+        tgt_dirs.update(os.path.join(tgt, d) for d in dirs)
+        copies.extend((os.path.join(root, f), os.path.join(tgt, f)) for f in files)
+
+    # parents sort before children, so each makedirs only creates one level
+    for d in sorted(tgt_dirs):
+        os.makedirs(d, exist_ok=True)
+    for s, t in copies:
+        if not os.path.exists(t):
+            shutil.copy2(s, t)  # sendfile on Linux, plus copystat
+
+_ISO_MONTH_RE = re.compile(r"\d{4}-(0[1-9]|1[0-2])")
+_ISO_DAY_RE = re.compile(r"\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])")
 
 @app.template_filter("uk_date")
 def uk_date(value):
-    from datetime import datetime
     if not value:
         return ""
     try:
         if len(value) == 4:  # year only
             return value
-        if len(value) == 7:  # YYYY-MM
-            dt = datetime.strptime(value, "%Y-%m")
-            return dt.strftime("%m/%Y")
-        if len(value) == 10:  # YYYY-MM-DD
-            dt = datetime.strptime(value, "%Y-%m-%d")
-            return dt.strftime("%d/%m/%Y")
+        # plain slicing is much cheaper than strptime/strftime on list pages
+        if len(value) == 7 and _ISO_MONTH_RE.fullmatch(value):  # YYYY-MM
+            return f"{value[5:7]}/{value[0:4]}"
+        if len(value) == 10 and _ISO_DAY_RE.fullmatch(value):  # YYYY-MM-DD
+            if value[8:10] > "28":  # month-length / leap-year check
+                datetime.strptime(value, "%Y-%m-%d")
+            return f"{value[8:10]}/{value[5:7]}/{value[0:4]}"
     except:
         pass
     return value
 
 
-@app.template_filter("uk_datetime")
-def uk_datetime(value):
-    try:
-        dt = datetime.fromisoformat(value)
-        return dt.strftime("%d %B %Y, %H:%M")
-    except Exception:
-        return value
-
 @app.template_filter("short_timestamp")
 def short_timestamp(value):
     return value.replace("T", " ")[:16] if value else ""
 
 
 def list_types(base="./types"):
-    return sorted([d for d in os.listdir(base) if os.path.isdir(os.path.join(base, d))])
+    return sorted(e.name for e in cached_scandir(base) if e.is_dir())
 
-def list_biographies(type_name, base="./types", include_archived=False):
+# type -> (cached_scandir listing it was built from, {bio_id: path})
+_BIO_INDEX = {}
+
+def find_bio_type(bio_id, base="./types"):
+    """
+    (type_name, path) of the first type (list_types order) holding <bio_id>.json, else (None, None).
+    Per-type id sets are rebuilt only when that biographies/ listing changes.
+    """
+    for t in list_types(base):
+        try:
+            entries = cached_scandir(os.path.join(base, t, "biographies"))
+        except OSError:
+            continue
+        hit = _BIO_INDEX.get(t)
+        if hit is None or hit[0] is not entries:
+            hit = (entries, {e.name[:-5]: e.path for e in entries if e.name.endswith(".json")})
+            _BIO_INDEX[t] = hit
+        path = hit[1].get(bio_id)
+        if path:
+            return t, path
+    return None, None
+
+def _try_load_bio(path):
+    """
+    Parsed bio JSON in one open (no exists() first). None if the file is missing;
+    an unreadable or corrupt file reads as {}, like load_json_as_dict.
+    """
+    pending = _pending_json(path)
+    if pending is not None:
+        return pending
+    try:
+        with open(path, "rb") as f:
+            buf = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        print(f"Error loading JSON file {path}: {e}")
+        return {}
+    try:
+        return json_loads(buf)
+    except ValueError as e:
+        print(f"Error loading JSON file {path}: {e}")
+        return {}
+
+def _time_selection_for(entry):
+    """Compact time summary for the Labels header, rebuilt from an entry's saved "time" block."""
+    t = (entry or {}).get("time")
+    if not isinstance(t, dict) or not t:
+        return None
+    if "label" in t:  # person_step time entries store the summary itself
+        return t
+    lt = t.get("label_type", "")
+    if lt in ("date", "dob"):
+        label = t.get("date_value", "")
+    elif lt == "range":
+        label = f"{t.get('start_date') or '?'}..{t.get('end_date') or ''}".strip(".")
+    else:
+        label = t.get("subvalue", "")
+    return {**t, "label": label}
+
+def _file_mtime_ns(entry) -> int:
+    try:
+        return os.stat(entry.path).st_mtime_ns  # fresh stat: cached DirEntry stats go stale
+    except OSError:
+        return 0
+
+# (bios_dir, include_archived, limit) -> ((cache generation, dir mtime_ns), list)
+_BIO_LIST_CACHE: dict = {}
+
+def list_biographies(type_name, base="./types", include_archived=False, limit=None):
+    """
+    List biographies of a type, newest updated first.
+    With `limit`, files are taken newest-mtime first and only the first
+    `limit` kept bios are parsed (for previews).
+    The list is reused until the folder or the save generation changes: treat it as read-only.
+    """
     bios_dir = os.path.join(base, type_name, "biographies")
     if not os.path.isdir(bios_dir):
         return []
 
+    ck = (bios_dir, include_archived, limit)
+    stamp = (cache_generation(), os.stat(bios_dir).st_mtime_ns)
+    hit = _BIO_LIST_CACHE.get(ck)
+    if hit and hit[0] == stamp:
+        return hit[1]
+
+    entries = [e for e in cached_scandir(bios_dir) if e.name.endswith(".json") and e.is_file()]
+    if limit is not None:
+        entries.sort(key=_file_mtime_ns, reverse=True)
+
     out = []
-    for f in os.listdir(bios_dir):
-        if not f.endswith(".json"):
-            continue
+    for entry in entries:
+        if limit is not None and len(out) >= limit:
+            break
+        f = entry.name
         bio_id = os.path.splitext(f)[0]
         try:
-            with open(os.path.join(bios_dir, f), "r", encoding="utf-8") as fp:
-                data = json.load(fp)
+            data = load_json_cached(os.path.join(bios_dir, f))
 
             # Skip archived unless explicitly included
             if not include_archived and data.get("archived", False):
                 continue
 
-            out.append({
+            archived = bool(data.get("archived", False))
+            out.append((archived, data.get("updated") or "", {
                 "id": bio_id,
                 "name": data.get("name", bio_id),
                 "description": data.get("description", ""),
-                "archived": bool(data.get("archived", False)),
+                "archived": archived,
                 "archived_at": data.get("archived_at", None),
-                "updated": data.get("updated", None)
-            })
+                "updated": data.get("updated", None),
+            }))
         except Exception:
-            out.append({
+            out.append((False, "", {
                 "id": bio_id,
                 "name": bio_id,
                 "description": "",
                 "archived": False,
                 "archived_at": None,
-                "updated": None
-            })
+                "updated": None,
+            }))
 
-    # Sort: active first, then archived; within each group, newest updated first
-    return sorted(
-        out,
-        key=lambda x: (x["archived"], x["updated"] or ""),
-        reverse=True
-    )
+    # Sort: active first, then archived; within each group, newest updated first.
+    # Rows are (archived, updated, bio): sort on the first two, hand back only the dicts.
+    out.sort(key=itemgetter(0, 1), reverse=True)
+    bios = [row[2] for row in out]
+    _BIO_LIST_CACHE[ck] = (stamp, bios)
+    return bios
 
 def has_label_subfolders(type_name: str) -> bool:
     labels_root = os.path.join("types", type_name, "labels")
@@ -346,7 +508,7 @@ def dashboard():
             return_url=url_for("dashboard", no_redirect=1)
         ))
 
-    preview = {t: list_biographies(t)[:6] for t in types}
+    preview = {t: list_biographies(t, limit=6) for t in types}
     return render_template("dashboard.html",
                            types=types,
                            preview=preview,
@@ -357,21 +519,23 @@ def index_page():
     person_bios = []
     types = []
 
-    for file in os.listdir("./types"):
+    for file in cached_listdir("./types"):
         if file.endswith(".json") and os.path.splitext(file)[0].lower() != "time":
             types.append(os.path.splitext(file)[0])
 
     person_dir = "./types/person/biographies"
     if os.path.exists(person_dir):
-        for af in os.listdir(person_dir):
-            if af.endswith(".json"):
-                agg_id = af[:-5]
-                data = load_json_as_dict(os.path.join(person_dir, af))
-                name = data.get("name", agg_id.replace("_", " "))
-                created = data.get("created", "")
-                person_bios.append((agg_id, name, created))
-
-    person_bios.sort(key=safe_date, reverse=True)
+        files = [af for af in cached_listdir(person_dir) if af.endswith(".json")]
+        datas = _load_json_many([os.path.join(person_dir, af) for af in files])
+        for af, data in zip(files, datas):
+            agg_id = af[:-5]
+            name = data.get("name", agg_id.replace("_", " "))
+            created = data.get("created", "")
+            person_bios.append((agg_id, name, created, _parse_iso_utc(created)))
+
+    # Parse each date once, sort on the cached value, then drop it for the template
+    person_bios.sort(key=itemgetter(3), reverse=True)
+    person_bios = [b[:3] for b in person_bios]
     return render_template("index.html", types=types, person_bios=person_bios)
 
 
@@ -391,9 +555,6 @@ def wizard_begin():
 
 @app.route("/add_type_prompt", methods=["GET", "POST"])
 def add_type_prompt():
-    def _slugify(s: str) -> str:
-        return re.sub(r"[^a-z0-9_]+", "_", (s or "").lower()).strip("_") or "untitled"
-
     if request.method == "POST":
         new_type_name = (request.form.get("new_type_name") or "").strip()
         base_type     = (request.form.get("base_type") or "").strip()
@@ -405,7 +566,7 @@ def add_type_prompt():
             flash("Please enter a type name.", "error")
             return redirect(url_for("add_type_prompt"))
 
-        slug = _slugify(new_type_name)
+        slug = _slugify_type_name(new_type_name)
 
         # folders
         type_root       = os.path.join("types", slug)
@@ -455,6 +616,7 @@ def add_type_prompt():
                 }
                 save_dict_as_json(top_level_path, descriptor)
 
+            bump_cache_generation()
             flash(f"Type '{new_type_name}' created.", "success")
             return redirect(url_for("dashboard"))
 
@@ -515,7 +677,7 @@ def type_browse(type_name):
                     continue
                 full = os.path.join(root, f)
                 key = os.path.splitext(f)[0]
-                fallback = key.replace("_", " ").title()
+                fallback = _humanize(key)
                 data, title = _title_from_json(full, fallback)
 
                 rel_path = "" if rel == "." else rel
@@ -544,58 +706,122 @@ def type_browse(type_name):
     )
 
 
+# ---------- Global search index ----------
+_SEARCH_SECTIONS = ("time", "people", "organisations", "buildings")
+_SEARCH_INDEX = {"stamp": None, "postings": {}, "names": {}, "order": {}, "terms": {}}
+
+def _search_tokens(text: str):
+    """Case-folded word tokens (letters in any script, digits, _) for the search index."""
+    return _SEARCH_TOK_RE.findall((text or "").casefold())
+
+def _build_search_index(person_dir: str):
+    """
+    Build {token: set(bio_id)} plus {bio_id: display_name} for the person bios.
+    Tokens come from the name and every value in the known sections (as str(),
+    the text _bio_matches_query searches).
+    """
+    postings = defaultdict(set)
+    names = {}
+    order = {}
+    files = [f for f in cached_listdir(person_dir) if f.endswith(".json")]
+    datas = _load_json_many([os.path.join(person_dir, f) for f in files])
+    for file, data in zip(files, datas):
+        bio_id = file[:-5]
+        try:
+            tokens = set(_search_tokens(data.get("name", "")))
+            for section in _SEARCH_SECTIONS:
+                for entry in data.get(section, []):
+                    if isinstance(entry, dict):
+                        for v in entry.values():
+                            tokens.update(_search_tokens(v if isinstance(v, str) else str(v)))
+                    elif isinstance(entry, str):
+                        tokens.update(_search_tokens(entry))
+            for tok in tokens:
+                postings[tok].add(bio_id)
+            names[bio_id] = data.get("name", bio_id)
+            order[bio_id] = len(order)
+        except Exception as e:
+            print(f"Error indexing {file}: {e}")
+            continue
+    return dict(postings), names, order
+
+def _get_search_index(person_dir: str):
+    """Return the cached index, rebuilding it when a bio is added, removed or modified."""
+    files = [f for f in cached_listdir(person_dir) if f.endswith(".json")]
+    max_mtime = 0
+    for f in files:
+        try:
+            max_mtime = max(max_mtime, os.stat(os.path.join(person_dir, f)).st_mtime_ns)
+        except OSError:
+            continue
+    stamp = (person_dir, len(files), max_mtime)
+    if _SEARCH_INDEX["stamp"] != stamp:
+        postings, names, order = _build_search_index(person_dir)
+        _SEARCH_INDEX.update(stamp=stamp, postings=postings, names=names, order=order, terms={})
+    return _SEARCH_INDEX
+
+def _bio_matches_query(data: dict, query: str) -> bool:
+    """The global search test: the lower-cased query is a substring of the name or of any value in the known sections."""
+    if query in data.get("name", "").lower():
+        return True
+    for section in _SEARCH_SECTIONS:
+        for entry in data.get(section, []):
+            if isinstance(entry, dict):
+                if any(query in str(v).lower() for v in entry.values()):
+                    return True
+            elif isinstance(entry, str) and query in entry.lower():
+                return True
+    return False
+
+def _search_term_ids(index, term: str):
+    """Bio ids whose tokens contain `term`; memoised per index build."""
+    ids = index["terms"].get(term)
+    if ids is None:
+        postings = index["postings"]
+        # substring match against the vocabulary, so partial words still hit
+        ids = frozenset().union(*(b for tok, b in postings.items() if term in tok))
+        index["terms"][term] = ids
+    return ids
+
 @app.route("/global_search")
 def global_search():
     query = request.args.get("q", "").lower()
     page = int(request.args.get("page", 1))
     per_page = 10
 
-    results = []
+    paginated = []
+    total = 0
     person_dir = "./types/person/biographies"
+    start = (page - 1) * per_page
+    end = start + per_page
 
     if query and os.path.exists(person_dir):
-        for file in os.listdir(person_dir):
-            if not file.endswith(".json"):
-                continue
-
+        index = _get_search_index(person_dir)
+        # the index only narrows the candidates: every word of the query has to occur
+        # inside some token of the bio; each candidate is then checked with the plain
+        # substring test, so punctuation and spacing in the query still count
+        terms = _search_tokens(query)
+        candidates = set(index["order"]) if not terms else None
+        for term in terms:
+            ids = _search_term_ids(index, term)
+            candidates = set(ids) if candidates is None else (candidates & ids)
+            if not candidates:
+                break
+        matched = []
+        for bid in candidates or ():
             try:
-                full_path = os.path.join(person_dir, file)
-                data = load_json_as_dict(full_path)
-                name = data.get("name", "").lower()
-                matched = False
-
-                # Check name
-                if query in name:
-                    matched = True
-
-                # Check entries in all known sections
-                for section in ["time", "people", "organisations", "buildings"]:
-                    for entry in data.get(section, []):
-                        # Only try .values() if it's a dictionary
-                        if isinstance(entry, dict):
-                            searchable = [str(v).lower() for v in entry.values()]
-                            if any(query in val for val in searchable if isinstance(val, str)):
-                                matched = True
-                                break
-                        elif isinstance(entry, str) and query in entry.lower():
-                            matched = True
-                            break
-
-                if matched:
-                    results.append((file[:-5], data.get("name", file[:-5])))
-
+                if _bio_matches_query(load_json_cached(os.path.join(person_dir, f"{bid}.json")), query):
+                    matched.append(bid)
             except Exception as e:
-                print(f"Error searching {file}: {e}")
-                continue
+                print(f"Error searching {bid}.json: {e}")
+        total = len(matched)
+        # only order the ids up to the end of the requested page
+        if start < total:
+            names = index["names"]
+            head = heapq.nsmallest(end, matched, key=index["order"].__getitem__)
+            paginated = [(bid, names[bid]) for bid in head[start:end]]
 
-    # Remove duplicates
-    results = list(dict(results).items())
-
-    # Paginate
-    start = (page - 1) * per_page
-    end = start + per_page
-    paginated = results[start:end]
-    total_pages = (len(results) + per_page - 1) // per_page
+    total_pages = (total + per_page - 1) // per_page
 
     return render_template(
         "global_search.html",
@@ -612,78 +838,253 @@ def api_search_person_bios():
     matches = []
 
     if query and os.path.exists(person_dir):
-        for file in os.listdir(person_dir):
+        for file in cached_listdir(person_dir):
             if not file.endswith(".json"):
                 continue
             try:
-                data = load_json_as_dict(os.path.join(person_dir, file))
+                data = load_json_cached(os.path.join(person_dir, file))
                 name = data.get("name", "").lower()
                 if query in name:
                     matches.append({
                         "person_id": file[:-5],
                         "name": data.get("name", file[:-5])
                     })
+                    if len(matches) >= 10:
+                        break  # Return only first 10 matches for speed
             except:
                 continue
 
-    return jsonify(matches[:10])  # Return only first 10 matches for speed
-
-def _read_json_safe(p):
-    try:
-        with open(p, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return {}
+    return jsonify(matches)
 
 def _tokenize(text: str):
-    text = (text or "").lower()
-    text = re.sub(r"[^a-z0-9_ ]+", " ", text)
-    parts = [w for w in text.split() if w]
-    return parts
+    return _TOK_RE.sub(" ", (text or "").lower()).split()
+
+# term -> small int id; only label text adds terms, so it stays bounded by the catalogue
+_VOCAB = {}
 
-def _kw_score(prompt_terms, haystack_terms):
+def _vocab_ids(terms, add: bool = False):
+    """Map terms to integer ids. Without `add`, unknown terms are dropped (they cannot match)."""
+    if add:
+        return [_VOCAB.setdefault(t, len(_VOCAB)) for t in terms]
+    return [_VOCAB[t] for t in terms if t in _VOCAB]
+
+def _kw_score(prompt_ids, sqrt_terms):
     # simple IR scoring: sum of sqrt(freq) for terms that overlap
-    if not prompt_terms or not haystack_terms:
+    # (sqrt_terms is the precomputed {term id: sqrt(freq)} table for one label)
+    if not prompt_ids or not sqrt_terms:
         return 0.0
-    freq = defaultdict(int)
-    for t in haystack_terms:
-        freq[t] += 1
-    s = 0.0
-    for t in prompt_terms:
-        if t in freq:
-            s += math.sqrt(freq[t])
-    return s
+    return sum(sqrt_terms[t] for t in prompt_ids if t in sqrt_terms)
 
-def _iter_all_label_files():
-    """Yield (type_name, group_key, label_id, path, meta). 
-       group_key is the folder path under labels (e.g. 'work_building')."""
+def _scan_json_files(top: str, rel: str = "."):
+    """Recursive os.scandir walk yielding (rel_dir, DirEntry) for every *.json file under top."""
+    subdirs = []
+    try:
+        with os.scandir(top) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry)
+                elif entry.name.endswith(".json") and entry.is_file():
+                    yield rel, entry
+    except OSError:
+        return
+    for d in subdirs:
+        yield from _scan_json_files(d.path, d.name if rel == "." else f"{rel}/{d.name}")
+
+def _scan_dir(path: str):
+    """(dir_entries, file_entries) for one directory, or None if it can't be read."""
+    dirs, files = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        return None
+    return dirs, files
+
+def _walk_scandir(root: str):
+    """os.walk equivalent on os.scandir: yields (dirpath, dir_entries, file_entries), top-down."""
+    res = _scan_dir(root)
+    if res is None:
+        return
+    dirs, files = res
+    yield root, dirs, files
+    for d in dirs:
+        yield from _walk_scandir(d.path)
+
+def _dirs_with_json(base: str):
+    """
+    Yield '/'-separated paths (relative to base, base itself excluded) of every folder
+    under base that directly holds at least one .json file. One scandir per folder.
+    """
+    stack = [base]
+    while stack:
+        path = stack.pop()
+        has_json = False
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif not has_json and entry.name.endswith(".json"):
+                        has_json = True
+        except OSError:
+            continue
+        if has_json and path != base:
+            yield os.path.relpath(path, base).replace("\\", "/")
+
+# How many directory reads _walk_scandir_prefetch keeps in flight ahead of the consumer
+_WALK_PREFETCH_DEPTH = 16
+
+def _walk_scandir_prefetch(root: str, depth: int = _WALK_PREFETCH_DEPTH):
+    """
+    Same yields, in the same order, as _walk_scandir, but the next `depth` directories
+    are already being scanned on _IO_POOL so cold-cache reads overlap instead of queueing
+    one at a time. Closing the generator early (e.g. on a match) cancels what's left.
+    """
+    stack = [root]
+    pending = {}
+    try:
+        while stack:
+            for p in stack[-depth:]:
+                if p not in pending:
+                    pending[p] = _IO_POOL.submit(_scan_dir, p)
+            path = stack.pop()
+            res = pending.pop(path).result()
+            if res is None:
+                continue
+            dirs, files = res
+            yield path, dirs, files
+            stack.extend(d.path for d in reversed(dirs))
+    finally:
+        for fut in pending.values():
+            fut.cancel()
+
+def _option_json_entries(folder: str):
+    """Option files (*.json except _group.json) directly in folder, sorted by name."""
+    try:
+        with os.scandir(folder) as it:
+            found = [e for e in it
+                     if e.name.endswith(".json") and e.name != "_group.json" and e.is_file()]
+    except OSError:
+        return []
+    found.sort(key=attrgetter("name"))
+    return found
+
+def _label_dirs():
+    """Yield (type_name, labels_dir) for every type that has a labels/ folder."""
     root = "types"
     if not os.path.isdir(root):
         return
-    for type_name in os.listdir(root):
-        tdir = os.path.join(root, type_name)
-        if not os.path.isdir(tdir):
-            continue
-        labels_dir = os.path.join(tdir, "labels")
-        if not os.path.isdir(labels_dir):
+    for tentry in cached_scandir(root):
+        if not tentry.is_dir():
             continue
-        # walk labels dir
-        for dirpath, _, files in os.walk(labels_dir):
-            rel_dir = os.path.relpath(dirpath, labels_dir).replace("\\", "/")
-            for f in files:
-                if not f.endswith(".json"):
-                    continue
-                if f == "_group.json":
-                    continue
-                # treat top-level property jsons as groups, but they aren’t options themselves
-                if rel_dir == "." and "/" not in f and f.endswith(".json") and os.path.isfile(os.path.join(dirpath, f)):
-                    # property json; skip as an option
-                    continue
-                label_id = os.path.splitext(f)[0]
-                path = os.path.join(dirpath, f)
-                meta = _read_json_safe(path)
-                group_key = "" if rel_dir == "." else rel_dir
-                yield type_name, group_key, label_id, path, meta
+        labels_dir = os.path.join(tentry.path, "labels")
+        if os.path.isdir(labels_dir):
+            yield tentry.name, labels_dir
+
+_JSON_READ_WORKERS = 16
+
+def _iter_label_entries():
+    """Yield (type_name, group_key, label_id, DirEntry) for every label option file."""
+    for type_name, labels_dir in _label_dirs():
+        for rel_dir, entry in _scan_json_files(labels_dir):
+            f = entry.name
+            if f == "_group.json":
+                continue
+            # treat top-level property jsons as groups, but they aren’t options themselves
+            if rel_dir == ".":
+                continue
+            yield type_name, rel_dir, os.path.splitext(f)[0], entry
+
+# shared pool for concurrent small-file reads (bios, label options)
+_IO_POOL = ThreadPoolExecutor(max_workers=_JSON_READ_WORKERS, thread_name_prefix="json-read")
+
+# Below this many files the pool's hand-off costs more than the overlapped reads save
+_POOL_MIN_BATCH = 16
+
+def _load_json_many(paths):
+    """load_json_cached over many paths, read concurrently so file latency overlaps (order kept)."""
+    if len(paths) < _POOL_MIN_BATCH:
+        return [load_json_cached(p) for p in paths]
+    return list(_IO_POOL.map(load_json_cached, paths))
+
+def _iter_all_label_files():
+    """Yield (type_name, group_key, label_id, path, meta). 
+       group_key is the folder path under labels (e.g. 'work_building')."""
+    found = [(t, g, lid, e.path) for t, g, lid, e in _iter_label_entries()]
+    metas = _load_json_many([item[3] for item in found])
+    for (type_name, group_key, label_id, path), meta in zip(found, metas):
+        yield type_name, group_key, label_id, path, meta
+
+_LABEL_INDEX = {"stamp": None, "items": [], "by_path": {}}
+
+def _label_files_stamp():
+    """(file count, newest mtime) over every labels/ tree; changes when any label changes."""
+    count, newest = 0, 0
+    for _, labels_dir in _label_dirs():
+        for _, entry in _scan_json_files(labels_dir):
+            try:
+                newest = max(newest, entry.stat().st_mtime_ns)
+            except OSError:
+                continue
+            count += 1
+    return (count, newest)
+
+# One scored label in the suggest_labels pool
+Candidate = namedtuple("Candidate", "type_name group_key id display description label_type score")
+
+def _label_index_item(tname, group_key, lid, meta):
+    name = (meta.get("properties") or _EMPTY).get("name") or meta.get("name") or lid
+    desc = meta.get("description") or (meta.get("properties") or _EMPTY).get("description", "")
+    terms = Counter(_vocab_ids(_tokenize(f"{lid} {name} {desc} {group_key} {tname}"), add=True))
+    # label_type = last segment of group_key if present, else group_key itself, else use tname
+    label_type = group_key.split("/")[-1] if group_key else tname
+    fields = (tname, group_key, lid, name, desc, label_type)
+    return fields, {t: math.sqrt(f) for t, f in terms.items()}
+
+def _get_label_index():
+    """
+    Tokenised label catalogue across all types, rebuilt only when a label file changes.
+    Each item is (Candidate fields without score, {term id: sqrt(freq)} table for scoring).
+    On rebuild, labels whose file is unchanged keep their item: only new or
+    edited files are parsed and tokenised again.
+    """
+    stamp = _label_files_stamp()
+    if _LABEL_INDEX["stamp"] == stamp:
+        return _LABEL_INDEX["items"]
+
+    old_by_path = _LABEL_INDEX["by_path"]
+    by_path = {}
+    slots = []     # [path, (mtime_ns, size), item or None] in walk order
+    todo = []      # (slot index, tname, group_key, lid, path)
+    for tname, group_key, lid, entry in _iter_label_entries():
+        try:
+            st = entry.stat()
+            sig = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            sig = None
+        prev = old_by_path.get(entry.path)
+        if prev and sig and prev[0] == sig:
+            item = prev[1]
+        else:
+            item = None
+            todo.append((len(slots), tname, group_key, lid, entry.path))
+        slots.append([entry.path, sig, item])
+
+    metas = _load_json_many([t[4] for t in todo])
+    for (i, tname, group_key, lid, _), meta in zip(todo, metas):
+        slots[i][2] = _label_index_item(tname, group_key, lid, meta)
+
+    items = []
+    for path, sig, item in slots:
+        items.append(item)
+        if sig:
+            by_path[path] = (sig, item)
+    _LABEL_INDEX.update(stamp=stamp, items=items, by_path=by_path)
+    return items
 
 def _build_candidate_pool(user_text: str, current_type: str, max_pool: int = 120):
     """
@@ -691,39 +1092,29 @@ def _build_candidate_pool(user_text: str, current_type: str, max_pool: int = 120
       - this type's labels/*
       - any other type's labels/*  (so cross-type 'hospital' appears)
     Rank by a quick keyword score using label id + name + description.
+    Returns a list of Candidate tuples.
     """
-    prompt_terms = _tokenize(user_text)
     scored = []
+    items = _get_label_index()
+    prompt_ids = _vocab_ids(_tokenize(user_text))
 
-    for tname, group_key, lid, p, meta in _iter_all_label_files():
-        # features to match against
-        name = (meta.get("properties", {}) or {}).get("name") or meta.get("name") or lid
-        desc = meta.get("description") or (meta.get("properties", {}) or {}).get("description", "")
-        hay = _tokenize(f"{lid} {name} {desc} {group_key} {tname}")
-        score = _kw_score(prompt_terms, hay)
+    for fields, sqrt_terms in items:
+        score = _kw_score(prompt_ids, sqrt_terms)
 
         # small boost if this is the same type
-        if tname == current_type:
+        if fields[0] == current_type:
             score *= 1.15
 
         if score > 0:
-            # label_type = last segment of group_key if present, else group_key itself, else use tname
-            label_type = (group_key.split("/")[-1] if group_key else tname)
-            scored.append({
-                "type_name": tname,
-                "group_key": group_key,    # e.g. 'work_building'
-                "id": lid,
-                "display": name,
-                "description": desc,
-                "label_type": label_type,
-                "score": score
-            })
+            scored.append(Candidate(*fields, score))
 
     # keep a diverse, high-quality subset
-    scored.sort(key=lambda x: (-x["score"], x["type_name"], x["group_key"], x["id"]))
-    return scored[:max_pool]
+    return heapq.nsmallest(
+        max_pool, scored,
+        key=lambda c: (-c.score, c.type_name, c.group_key, c.id)
+    )
 
-def _gpt_pick_labels(prompt_text: str, candidates: list, max_return: int = 8):
+def _gpt_pick_labels(prompt_text: str, candidates: list, max_return: int = 8, current_type: str = ""):
     """
     Ask GPT to select the most relevant candidate label ids.
     We pass candidates (already filtered & ranked) to keep GPT on the rails.
@@ -731,27 +1122,29 @@ def _gpt_pick_labels(prompt_text: str, candidates: list, max_return: int = 8):
     if not candidates:
         return []
 
-    # compact candidate list for the model
-    cand_summary = [
-        {
-            "id": c["id"],
-            "label_type": c["label_type"],
-            "group_key": c["group_key"],
-            "type": c["type_name"],
-            "display": c["display"],
-        } for c in candidates
-    ]
+    # compact candidate list for the model ('type' only when it differs from the current one)
+    cand_summary = []
+    for c in candidates:
+        item = {
+            "id": c.id,
+            "label_type": c.label_type,
+            "group_key": c.group_key,
+            "display": c.display,
+        }
+        if c.type_name != current_type:
+            item["type"] = c.type_name
+        cand_summary.append(item)
 
     system = (
         "You help map a short description to label IDs from a fixed catalog. "
         "Only choose from the provided candidates. Prefer the few best matches. "
-        f"Return at most {max_return} items as a JSON list of objects with keys: "
+        f"Return a JSON object {{\"picks\": [...]}} with at most {max_return} objects with keys: "
         "id, label_type, (optional) confidence (0-100)."
     )
     user = (
         f"User description: {prompt_text}\n\n"
-        "Candidate labels (id, label_type, group_key, type, display):\n"
-        f"{json.dumps(cand_summary, ensure_ascii=False)}\n\n"
+        "Candidate labels (id, label_type, group_key, display; 'type' only for labels from another type):\n"
+        f"{json.dumps(cand_summary, ensure_ascii=False, separators=(',', ':'))}\n\n"
         "Pick the most relevant few."
     )
 
@@ -764,13 +1157,15 @@ def _gpt_pick_labels(prompt_text: str, candidates: list, max_return: int = 8):
             ],
             temperature=0.2,
             max_tokens=600,
+            response_format={"type": "json_object"},
         )
-        content = resp.choices[0].message.content.strip()
-        # Try to parse a JSON array out of the content
-        # Be permissive: allow the model to wrap in text
-        m = re.search(r"\[.*\]", content, re.S)
-        raw = m.group(0) if m else content
-        data = json.loads(raw)
+        data = json.loads(resp.choices[0].message.content)
+        if isinstance(data, dict):
+            data = data.get("picks") or []
+        # first candidate wins for duplicate ids, as with the old linear scan
+        by_id = {}
+        for c in candidates:
+            by_id.setdefault(c.id, c)
         out = []
         for x in data:
             if not isinstance(x, dict):
@@ -778,17 +1173,17 @@ def _gpt_pick_labels(prompt_text: str, candidates: list, max_return: int = 8):
             if "id" not in x:
                 continue
             # Find the candidate to copy display/desc/type info
-            ref = next((c for c in candidates if c["id"] == x["id"]), None)
+            ref = by_id.get(x["id"])
             if not ref:
                 continue
             out.append({
                 "id": x["id"],
-                "label_type": x.get("label_type") or ref["label_type"],
-                "display": ref["display"],
-                "description": ref["description"],
+                "label_type": x.get("label_type") or ref.label_type,
+                "display": ref.display,
+                "description": ref.description,
                 "confidence": int(x.get("confidence", 100)),
-                "group_key": ref["group_key"],
-                "type": ref["type_name"],
+                "group_key": ref.group_key,
+                "type": ref.type_name,
             })
         return out[:max_return]
     except Exception as e:
@@ -809,13 +1204,13 @@ def api_suggest_labels():
             return jsonify({"labels": []})
 
         # 1) Build a strong candidate pool across all types (with a small bias to current_type)
-        pool = _build_candidate_pool(user_text, current_type, max_pool=120)
+        pool = _build_candidate_pool(user_text, current_type, max_pool=40)
 
         # 2) Hand the short list to GPT to pick ~5–8
-        picked = _gpt_pick_labels(user_text, pool, max_return=8)
+        picked = _gpt_pick_labels(user_text, pool, max_return=8, current_type=current_type)
 
         # 3) Final sanity check: only return ids that exist in the pool
-        pool_ids = {c["id"] for c in pool}
+        pool_ids = {c.id for c in pool}
         result = [p for p in picked if p["id"] in pool_ids]
 
         return jsonify({"labels": result})
@@ -835,7 +1230,7 @@ def api_labels_admin_bootstrap():
 
     # Collect groups using your existing helper
     try:
-        groups = collect_label_groups(base, type_name) or []
+        groups = _collect_label_groups_cached(base, type_name) or []
     except Exception:
         groups = []
 
@@ -890,10 +1285,8 @@ def api_labels_admin_create_group():
         return {"ok": False, "error": "missing_fields"}, 400
 
     base_desc = os.path.join("types", type_name, "labels", key + ".json")
-    if os.path.exists(base_desc):
-        return {"ok": False, "error": "group_exists"}, 409
 
-    data = {"label": label or key.replace("_"," ").title(), "description": desc, "order": order}
+    data = {"label": label or _humanize(key), "description": desc, "order": order}
     # allow linking a property to other biographies
     if isinstance(refer_to, dict):
         src = (refer_to.get("source") or "").strip().lower()
@@ -901,7 +1294,8 @@ def api_labels_admin_create_group():
         if src == "biographies" and rtype:
             data["refer_to"] = {"source": "biographies", "type": rtype}
 
-    _safe_json_write(base_desc, data)
+    if not _safe_json_create(base_desc, data):
+        return {"ok": False, "error": "group_exists"}, 409
     os.makedirs(os.path.join("types", type_name, "labels", key), exist_ok=True)
     return {"ok": True, "group_key": key}
 
@@ -928,21 +1322,103 @@ def api_labels_admin_create_child_group():
         return {"ok": False, "error": "parent_missing"}, 404
 
     child_desc = os.path.join(parent_folder, f"{child_key}.json")
-    if os.path.exists(child_desc):
-        return {"ok": False, "error": "child_exists"}, 409
 
-    data = {"label": label or child_key.replace("_"," ").title(), "description": desc, "order": order}
+    data = {"label": label or _humanize(child_key), "description": desc, "order": order}
     if isinstance(refer_to, dict):
         src = (refer_to.get("source") or "").strip().lower()
         rtype = _slugify(refer_to.get("type") or "")
         if src == "biographies" and rtype:
             data["refer_to"] = {"source": "biographies", "type": rtype}
 
-    _safe_json_write(child_desc, data)
+    if not _safe_json_create(child_desc, data):
+        return {"ok": False, "error": "child_exists"}, 409
     os.makedirs(os.path.join(parent_folder, child_key), exist_ok=True)
     return {"ok": True, "child_key": f"{parent_key}/{child_key}"}
 
 
+_TYPES_TREE_TTL = 5.0
+
+def _types_tree_stamp():
+    """
+    Cache-key stamp for data read from types/: the write generation (bumped by every
+    JSON write through utils) plus a coarse time slot, so edits made outside the app
+    are picked up within a few seconds. No directory walk.
+    """
+    return (cache_generation(), int(time.monotonic() // _TYPES_TREE_TTL))
+
+@lru_cache(maxsize=512)
+def _type_paths(type_name: str) -> tuple:
+    """(types/<t>, types/<t>/labels, types/<t>/biographies) for a type name."""
+    root = os.path.join("types", type_name)
+    return root, os.path.join(root, "labels"), os.path.join(root, "biographies")
+
+@lru_cache(maxsize=4096)
+def _key_segments(key: str) -> tuple:
+    """Group keys / refer_to paths ("a/b/", always '/'-separated) as a tuple of path segments."""
+    return tuple(p for p in key.split("/") if p)
+
+def _groups_by_key(groups) -> dict:
+    """{key: group}; the first group wins on duplicate keys (like a next() scan)."""
+    out = {}
+    for g in groups or []:
+        out.setdefault(g.get("key") or "", g)
+    return out
+
+# groups: collector output; by_key: {key: group}; option_index: {option id: group key}
+GroupCache = namedtuple("GroupCache", "groups by_key option_index")
+
+@lru_cache(maxsize=64)
+def _collect_label_groups_at(label_base: str, current_type: str, stamp, collector):
+    groups = collector(label_base, current_type)
+    # option id -> group key; a later group wins on duplicate ids
+    option_index = {str(opt["id"]): g["key"]
+                    for g in groups or [] if g.get("key")
+                    for opt in g.get("options") or [] if opt.get("id")}
+    return GroupCache(groups, _groups_by_key(groups), option_index)
+
+def _cached_groups(label_base: str, current_type: str, collector=None):
+    """
+    GroupCache for collect_label_groups (or another collector with the same signature),
+    memoised until the next write (or a few seconds). Treat every part as read-only.
+    """
+    return _collect_label_groups_at(label_base, current_type, _types_tree_stamp(),
+                                    collector or collect_label_groups)
+
+def _collect_label_groups_cached(label_base: str, current_type: str, collector=None):
+    """The group list from _cached_groups."""
+    return _cached_groups(label_base, current_type, collector).groups
+
+# (id(GroupCache), type, label base, selections) -> (GroupCache, expanded groups, option index)
+_EXPANDED_CACHE: dict = {}
+_EXPANDED_CACHE_MAX = 256
+
+def _expanded_groups(cache: GroupCache, current_type: str, label_base: str, selections: dict):
+    """
+    expand_child_groups over cache.groups for these selections ({group key: option id}),
+    plus its option id -> group key index. Memoised per GroupCache, so a tree change
+    (new GroupCache) starts afresh; the entry holds the GroupCache so its id() stays unique.
+    Treat both results as read-only.
+    """
+    ck = (id(cache), current_type, label_base, frozenset(selections.items()))
+    hit = _EXPANDED_CACHE.get(ck)
+    if hit is not None:
+        return hit[1], hit[2]
+
+    groups = expand_child_groups(
+        base_groups=cache.groups,
+        current_type=current_type,
+        label_base_path=label_base,
+        existing_labels=selections,
+    )
+    index = {str(opt["id"]): g["key"]
+             for g in groups or [] if g.get("key")
+             for opt in g.get("options") or [] if opt.get("id")}
+
+    if len(_EXPANDED_CACHE) >= _EXPANDED_CACHE_MAX:
+        _EXPANDED_CACHE.pop(next(iter(_EXPANDED_CACHE)))
+    _EXPANDED_CACHE[ck] = (cache, groups, index)
+    return groups, index
+
 @app.post("/api/labels/resolve_option")
 def api_resolve_option():
     """
@@ -968,17 +1444,22 @@ def api_resolve_option():
 
     # Build current groups (property-first, with refer_to hints)
     label_base = os.path.join("types", type_name, "labels")
-    groups = collect_label_groups(label_base_path=label_base, current_type=type_name)
+    groups = _collect_label_groups_cached(label_base, type_name)
 
     oid = option_id.strip()
     oid_l = oid.lower()
 
-    # Helper: list json basenames in a folder (lowercased)
+    # Helper: list json basenames in a folder (lowercased), memoised for this request
+    names_cache = {}
     def json_names_lower(folder):
-        try:
-            return {os.path.splitext(f)[0].lower() for f in os.listdir(folder) if f.endswith(".json")}
-        except Exception:
-            return set()
+        names = names_cache.get(folder)
+        if names is None:
+            try:
+                names = {os.path.splitext(f)[0].lower() for f in os.listdir(folder) if f.endswith(".json")}
+            except Exception:
+                names = set()
+            names_cache[folder] = names
+        return names
 
     # ---------- 1) Direct match inside any top-level group ----------
     for g in groups:
@@ -989,14 +1470,15 @@ def api_resolve_option():
     # ---------- 2) Search for child under SAME-TYPE label tree ----------
     # e.g. types/<current>/labels/<g.key>/<parent_id>/<oid>.json
     for g in groups:
-        base_path = g.get("key", "").strip("/")
-        if not base_path:
+        segs = _key_segments(g.get("key", ""))
+        if not segs:
             continue
+        group_dir = os.path.join(label_base, *segs)
         for parent in g.get("options", []):
             parent_id = (parent.get("id") or "").strip()
             if not parent_id:
                 continue
-            child_dir = os.path.join(label_base, *base_path.split("/"), parent_id)
+            child_dir = os.path.join(group_dir, parent_id)
             if os.path.isdir(child_dir) and oid_l in json_names_lower(child_dir):
                 child_key = f"{g['key']}/{parent_id}"
                 return jsonify(
@@ -1014,10 +1496,9 @@ def api_resolve_option():
             continue
 
         search_type = (src.get("type") or type_name).strip()
-        base_path   = (src.get("path") or g["key"]).strip("/")
 
         # Root where the parent options live
-        cross_root = os.path.join("types", search_type, "labels", *base_path.split("/"))
+        cross_root = os.path.join("types", search_type, "labels", *_key_segments(src.get("path") or g["key"]))
 
         for parent in g.get("options", []):
             parent_id = (parent.get("id") or "").strip()
@@ -1038,48 +1519,58 @@ def api_resolve_option():
     # ---------- 4) Fallback: scan all types to find a folder that contains <oid>.json,
     # then try to map it back to a current group with a matching refer_to root ----------
     try:
-        types_root = "types"
-        for tname in os.listdir(types_root):
-            tdir = os.path.join(types_root, tname)
-            if not os.path.isdir(tdir):
-                continue
-            labels_root = os.path.join(tdir, "labels")
-            if not os.path.isdir(labels_root):
-                continue
-
-            for dirpath, _, files in os.walk(labels_root):
-                basenames = {os.path.splitext(f)[0].lower() for f in files if f.endswith(".json")}
-                if oid_l not in basenames:
+        target = oid_l + ".json"
+        # (type, base path segments) -> first current group whose refer_to points there
+        refer_roots = {}
+        for g in groups:
+            src = g.get("refer_to") or {}
+            if src.get("source") == "labels":
+                refer_roots.setdefault(
+                    (src.get("type") or type_name, _key_segments(src.get("path") or g["key"])), g)
+
+        for tname, labels_root in _label_dirs():
+            for dirpath, _, file_entries in _walk_scandir_prefetch(labels_root):
+                if not any(e.name.lower() == target for e in file_entries):
                     continue
 
                 # dirpath looks like: types/<tname>/labels/<some/base>/<maybe parent>
-                rel_from_labels = os.path.relpath(dirpath, labels_root).replace("\\", "/")
-                parts = rel_from_labels.split("/") if rel_from_labels != "." else []
+                rel_from_labels = os.path.relpath(dirpath, labels_root)
+                parts = tuple(rel_from_labels.split(os.sep)) if rel_from_labels != "." else ()
                 # if there is a parent folder, parts[-1] is parent_id and parts[:-1] is base_path
                 if parts:
                     parent_id = parts[-1]
-                    base_path = "/".join(parts[:-1])
 
                     # Find a group in current type whose refer_to matches (tname, base_path)
-                    for g in groups:
-                        src = g.get("refer_to") or {}
-                        if (src.get("source") == "labels" and
-                            (src.get("type") or type_name) == tname and
-                            (src.get("path") or g["key"]).strip("/") == base_path):
-                            child_key = f"{g['key']}/{parent_id}"
-                            return jsonify(
-                                ok=True,
-                                group_key=child_key,
-                                parent_id=parent_id,
-                                child_key=child_key,
-                                child_id=oid
-                            )
+                    g = refer_roots.get((tname, parts[:-1]))
+                    if g is not None:
+                        child_key = f"{g['key']}/{parent_id}"
+                        return jsonify(
+                            ok=True,
+                            group_key=child_key,
+                            parent_id=parent_id,
+                            child_key=child_key,
+                            child_id=oid
+                        )
     except Exception as e:
         print("[resolve_option fallback] error:", e)
 
     return jsonify(ok=False)
 
 
+def _flatten_selections(sel) -> dict:
+    """Normalise {key: "id"} / {key: {"label"|"id": ...}} selections to a flat {key: "id"}."""
+    out = {}
+    for k, v in (sel or {}).items():
+        if isinstance(v, dict):
+            v = v.get("label") or v.get("id")
+        out[k] = str(v) if v else ""
+    return out
+
+def _json_response(obj, status: int = 200):
+    """jsonify() equivalent (sorted keys, compact) serialised straight to bytes, via orjson when installed."""
+    return Response(dumps_json_bytes(obj, indent=None, sort_keys=True), status=status,
+                    mimetype="application/json")
+
 @app.route("/api/labels/children", methods=["POST"])
 def api_labels_children():
     """
@@ -1100,8 +1591,8 @@ def api_labels_children():
         # Where are the child options located on disk?
         # Mirrors expand_child_groups() logic (self or cross-type when allowed).
         # First, figure out whether this group uses cross-type labels.
-        base_groups = collect_label_groups(label_base_path, type_name)
-        parent = next((g for g in base_groups if g.get("key") == group_key), None)
+        groups_idx = _cached_groups(label_base_path, type_name).by_key
+        parent = groups_idx.get(group_key)
         if not parent:
             return jsonify({"ok": False, "reason": f"Unknown group '{group_key}'"}), 404
 
@@ -1111,12 +1602,12 @@ def api_labels_children():
 
         # default: same type
         search_type = type_name
-        base_path   = group_key
+        base_segs   = _key_segments(group_key)
 
         if kind == "labels":
             # cross-type labels
             search_type = src.get("type") or type_name
-            base_path   = (src.get("path") or group_key).strip("/")
+            base_segs   = _key_segments(src.get("path") or group_key)
             if search_type != type_name and not allow_children:
                 return jsonify({"ok": False, "reason": "Children not allowed for this cross-type source"}), 200
 
@@ -1126,9 +1617,9 @@ def api_labels_children():
 
         # Resolve absolute folder
         if search_type == type_name:
-            folder = os.path.join(label_base_path, *base_path.split("/"), selected_id)
+            folder = os.path.join(label_base_path, *base_segs, selected_id)
         else:
-            folder = os.path.join("types", search_type, "labels", *base_path.split("/"), selected_id)
+            folder = os.path.join("types", search_type, "labels", *base_segs, selected_id)
 
         if not os.path.isdir(folder):
             return jsonify({"ok": True, "child_key": None, "options": []}), 200
@@ -1136,27 +1627,25 @@ def api_labels_children():
         # Load options from that folder
         def _collect_opts(folder_abs):
             out = []
-            for f in sorted(os.listdir(folder_abs)):
-                if not f.endswith(".json") or f == "_group.json":
-                    continue
-                p = os.path.join(folder_abs, f)
-                j = load_json_as_dict(p)
-                lid = os.path.splitext(f)[0]
-                disp = (j.get("properties", {}) or {}).get("name") or j.get("name") or lid
-                desc = j.get("description", (j.get("properties", {}) or {}).get("description", ""))
+            entries = _option_json_entries(folder_abs)
+            images = image_urls(folder_abs, (".png", ".jpg", ".jpeg", ".webp"),
+                                [e.name[:-5] for e in entries])
+            datas = _load_json_many([e.path for e in entries])
+            for e, j in zip(entries, datas):
+                lid = e.name[:-5]
+                props = j.get("properties") or _EMPTY
+                disp = props.get("name") or j.get("name") or lid
+                desc = j.get("description", props.get("description", ""))
                 opt = {"id": lid, "display": disp, "description": desc}
                 # try sibling image
-                for ext in (".png", ".jpg", ".jpeg", ".webp"):
-                    imgp = os.path.join(folder_abs, lid + ext)
-                    if os.path.exists(imgp):
-                        rel = os.path.relpath(imgp, ".").replace("\\", "/")
-                        opt["image"] = "/" + rel if not rel.startswith("types/") else f"/{rel}"
-                        break
+                img = images.get(lid)
+                if img:
+                    opt["image"] = img
                 out.append(opt)
             return out
 
         options = _collect_opts(folder)
-        child_key = f"{base_path}/{selected_id}"
+        child_key = "/".join(base_segs + (selected_id,))
         return jsonify({"ok": True, "child_key": child_key, "options": options}), 200
 
     except Exception as e:
@@ -1178,7 +1667,7 @@ def api_suggest_biographies():
         data = request.get_json(force=True, silent=False) or {}
         type_name  = (data.get("type_name") or "").strip()
         group_key  = (data.get("group_key") or "").strip()
-        selections = data.get("selections") or {}
+        selections = _flatten_selections(data.get("selections"))
         if not (type_name and group_key):
             return jsonify({"ok": False, "reason": "Missing type_name/group_key"}), 400
 
@@ -1197,7 +1686,7 @@ def api_suggest_biographies():
                     except Exception:
                         j = {}
                     bid = (j.get("id") or os.path.splitext(f)[0]).strip()
-                    disp = (j.get("name") or j.get("display") or bid.replace("_"," ").title()).strip()
+                    disp = (j.get("name") or j.get("display") or _humanize(bid)).strip()
                     desc = (j.get("description") or "").strip()
                     if bid:
                         item = {"id": bid, "display": disp}
@@ -1213,30 +1702,19 @@ def api_suggest_biographies():
             cur = group_key
             while True:
                 sel = selections.get(cur)
-                if isinstance(sel, dict):
-                    sel = sel.get("label") or sel.get("id")
                 if not sel:
                     break
-                parts.append(str(sel))
+                parts.append(sel)
                 cur = f"{cur}/{sel}"
             return parts
 
         # --- load groups (use whichever helper exists in your app) --------------
         label_base_path = os.path.join("types", type_name, "labels")
-        try:
-            base_groups = _collect_label_groups(label_base_path, type_name)   # new helper
-        except NameError:
-            base_groups = collect_label_groups(label_base_path, type_name)     # legacy
-
-        expanded = expand_child_groups(
-            base_groups=base_groups,
-            current_type=type_name,
-            label_base_path=label_base_path,
-            existing_labels=selections,
-        )
+        group_cache = _cached_groups(label_base_path, type_name, _collect_label_groups)
+        expanded, _ = _expanded_groups(group_cache, type_name, label_base_path, selections)
 
         # Find the specific group we are asking about
-        group = next((g for g in expanded if (g.get("key") or "") == group_key), None)
+        group = _groups_by_key(expanded).get(group_key)
 
         # Work out biography base + mode
         # Accept modern {"refer_to":{"source":"biographies", ...}} and legacy {"link_biography": {...}}
@@ -1306,27 +1784,63 @@ def api_suggest_biographies():
 
 # --- Helpers ---------------------------------------------------------------
 
+_GROUP_STORAGE_TTL = 5.0
+_GROUP_STORAGE_CACHE = {}   # (type_name, group_key) -> (generation, deadline, result)
+
 def _group_storage(type_name: str, group_key: str):
     """
     Return ('folder', dir_path) if options live as files in a folder,
            ('file',   json_path) if options live inside a single <group>.json,
            or (None, None) if neither exists.
+    Memoised for a few seconds; any JSON write through utils invalidates it.
     """
+    ck = (type_name, group_key)
+    now = time.monotonic()
+    hit = _GROUP_STORAGE_CACHE.get(ck)
+    if hit and hit[0] == cache_generation() and now < hit[1]:
+        return hit[2]
+
     base = os.path.join("types", type_name, "labels")
     dir_path  = os.path.join(base, group_key)
     json_path = os.path.join(base, f"{group_key}.json")
-    if os.path.isdir(dir_path):
-        return "folder", dir_path
-    if os.path.isfile(json_path):
-        return "file", json_path
-    return None, None
+
+    # one readdir of the parent tells us both whether <key>/ and <key>.json exist
+    leaf = os.path.basename(dir_path)
+    is_dir = is_file = False
+    try:
+        with os.scandir(os.path.dirname(dir_path)) as it:
+            for e in it:
+                if e.name == leaf:
+                    is_dir = e.is_dir()
+                elif e.name == leaf + ".json":
+                    is_file = e.is_file()
+    except OSError:
+        pass
+
+    if is_dir:
+        result = ("folder", dir_path)
+    elif is_file:
+        result = ("file", json_path)
+    else:
+        result = (None, None)
+    _GROUP_STORAGE_CACHE[ck] = (cache_generation(), now + _GROUP_STORAGE_TTL, result)
+    return result
 
 
-def _write_json_safely(path: str, payload: dict) -> bool:
+def _read_json(path: str) -> dict:
+    pending = _pending_json(path)
+    if pending is not None:
+        return pending
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
+        with open(path, "rb") as f:
+            return json_loads(f.read()) or {}
+    except Exception:
+        return {}
+
+
+def _write_json(path: str, payload: dict) -> bool:
+    try:
+        write_json_atomic(path, payload)
         return True
     except Exception as e:
         print("ERROR writing", path, "->", e)
@@ -1341,7 +1855,7 @@ def _archive_in_folder(dir_path: str, option_id: str, child_id: str, archive: bo
     jf = os.path.join(dir_path, f"{option_id}.json")
     if not os.path.isfile(jf):
         return False
-    data = load_json_as_dict(jf) or {}
+    data = _read_json(jf)
     changed = False
 
     if child_id:
@@ -1359,7 +1873,7 @@ def _archive_in_folder(dir_path: str, option_id: str, child_id: str, archive: bo
         elif not archive and data.get("archived"):
             data.pop("archived", None); changed = True
 
-    return _write_json_safely(jf, data) if changed else False
+    return _write_json(jf, data) if changed else False
 
 
 def _archive_in_file(json_path: str, option_id: str, child_id: str, archive: bool) -> bool:
@@ -1369,7 +1883,7 @@ def _archive_in_file(json_path: str, option_id: str, child_id: str, archive: boo
     """
     if not os.path.isfile(json_path):
         return False
-    doc = load_json_as_dict(json_path) or {}
+    doc = _read_json(json_path)
     opts = doc.get("options") or []
     changed = False
 
@@ -1391,7 +1905,7 @@ def _archive_in_file(json_path: str, option_id: str, child_id: str, archive: boo
                     o.pop("archived", None); changed = True
             break
 
-    return _write_json_safely(json_path, {"options": opts}) if changed else False
+    return _write_json(json_path, {"options": opts}) if changed else False
 
 
 def _do_archive_label(*, target_type: str, group_key: str, option_id: str, child_id: str, archive: bool) -> bool:
@@ -1409,142 +1923,37 @@ def _do_archive_label(*, target_type: str, group_key: str, option_id: str, child
 
 # --- API endpoints ---------------------------------------------------------
 
-@app.post("/api/archive_label/<type_name>")
-def api_archive_label(type_name):
-    # From the form in type_labels.html
-    group_key   = (request.form.get("group_key") or "").strip()
-    option_id   = (request.form.get("option_id") or "").strip()
-    child_id    = (request.form.get("child_id") or "").strip()
+def _archive_endpoint(type_name: str, archive: bool):
+    """Shared body of the archive/unarchive label form posts (from type_labels.html)."""
+    form = request.form
+    group_key   = (form.get("group_key") or "").strip()
+    option_id   = (form.get("option_id") or "").strip()
+    child_id    = (form.get("child_id") or "").strip()
     # For property-link groups, these override where we write:
-    target_type = (request.form.get("target_type") or type_name).strip()
-    target_path = (request.form.get("target_path") or group_key).strip()
-
-    ok = _do_archive_label(
-        target_type=target_type,
-        group_key=target_path,
-        option_id=option_id,
-        child_id=child_id,
-        archive=True,
-    )
-    flash("Label archived." if ok else "Couldn’t archive label (not found?).", "success" if ok else "error")
-    return redirect(request.form.get("next") or request.referrer or url_for("type_labels", type_name=type_name))
-
-
-@app.post("/api/unarchive_label/<type_name>")
-def api_unarchive_label(type_name):
-    group_key   = (request.form.get("group_key") or "").strip()
-    option_id   = (request.form.get("option_id") or "").strip()
-    child_id    = (request.form.get("child_id") or "").strip()
-    target_type = (request.form.get("target_type") or type_name).strip()
-    target_path = (request.form.get("target_path") or group_key).strip()
+    target_type = (form.get("target_type") or type_name).strip()
+    target_path = (form.get("target_path") or group_key).strip()
 
     ok = _do_archive_label(
         target_type=target_type,
         group_key=target_path,
         option_id=option_id,
         child_id=child_id,
-        archive=False,
+        archive=archive,
     )
-    flash("Label unarchived." if ok else "Couldn’t unarchive label (not found?).", "success" if ok else "error")
-    return redirect(request.form.get("next") or request.referrer or url_for("type_labels", type_name=type_name))
-
-
-def _group_storage(type_name: str, group_key: str):
-    base = os.path.join("types", type_name, "labels")
-    dir_path  = os.path.join(base, group_key)
-    json_path = os.path.join(base, f"{group_key}.json")
-    if os.path.isdir(dir_path):
-        return "folder", dir_path
-    if os.path.isfile(json_path):
-        return "file", json_path
-    return None, None
-
+    verb = "archive" if archive else "unarchive"
+    flash(f"Label {verb}d." if ok else f"Couldn’t {verb} label (not found?).", "success" if ok else "error")
+    return redirect(form.get("next") or request.referrer or url_for("type_labels", type_name=type_name))
 
-def _read_json(path: str) -> dict:
-    try:
-        return load_json_as_dict(path) or {}
-    except Exception:
-        return {}
 
+@app.post("/api/archive_label/<type_name>")
+def api_archive_label(type_name):
+    return _archive_endpoint(type_name, True)
 
-def _write_json(path: str, payload: dict) -> bool:
-    try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, indent=2, ensure_ascii=False)
-        return True
-    except Exception as e:
-        print("Write error:", path, e)
-        return False
-
-
-def _set_group_archived(type_name: str, group_key: str, archive: bool, cascade: bool = False) -> bool:
-    """
-    For folder groups -> write types/<T>/labels/<GROUP>/_group.json with {"archived": true/false}
-    For file groups   -> set {"archived": true/false} at top of types/<T>/labels/<GROUP>.json
-    If cascade=True, also toggle every option's archived flag.
-    """
-    storage, path = _group_storage(type_name, group_key)
-    if storage is None:
-        return False
-
-    changed = False
-
-    if storage == "folder":
-        meta_path = os.path.join(path, "_group.json")
-        meta = _read_json(meta_path)
-        if archive and not meta.get("archived"):
-            meta["archived"] = True; changed = True
-        elif not archive and meta.get("archived"):
-            meta.pop("archived", None); changed = True
-        if changed:
-            if not _write_json(meta_path, meta):
-                return False
-
-        if cascade:
-            for fn in sorted(os.listdir(path)):
-                if not fn.endswith(".json") or fn == "_group.json":
-                    continue
-                jf = os.path.join(path, fn)
-                data = _read_json(jf)
-                # option itself
-                if archive and not data.get("archived"):
-                    data["archived"] = True; changed = True
-                elif not archive and data.get("archived"):
-                    data.pop("archived", None); changed = True
-                # children
-                kids = data.get("children") or []
-                for k in kids:
-                    if archive and not k.get("archived"):
-                        k["archived"] = True; changed = True
-                    elif not archive and k.get("archived"):
-                        k.pop("archived", None); changed = True
-                _write_json(jf, data)
-
-        return True
 
-    # storage == "file"
-    doc = _read_json(path)
-    if archive and not doc.get("archived"):
-        doc["archived"] = True; changed = True
-    elif not archive and doc.get("archived"):
-        doc.pop("archived", None); changed = True
-
-    if cascade:
-        opts = doc.get("options") or []
-        for o in opts:
-            if archive and not o.get("archived"):
-                o["archived"] = True; changed = True
-            elif not archive and o.get("archived"):
-                o.pop("archived", None); changed = True
-            for k in (o.get("children") or []):
-                if archive and not k.get("archived"):
-                    k["archived"] = True; changed = True
-                elif not archive and k.get("archived"):
-                    k.pop("archived", None); changed = True
-        doc["options"] = opts
+@app.post("/api/unarchive_label/<type_name>")
+def api_unarchive_label(type_name):
+    return _archive_endpoint(type_name, False)
 
-    return _write_json(path, doc)
 
 @app.route("/api/bio/<type_name>/<bio_id>/archive", methods=["POST"])
 def api_archive_bio(type_name, bio_id):
@@ -1615,10 +2024,9 @@ def time_step(type_name, bio_id):
     os.makedirs(bio_folder, exist_ok=True)
 
     bio_file = os.path.join(bio_folder, f"{bio_id}.json")
-    if not os.path.exists(bio_file):
+    bio_data = _try_load_bio(bio_file)
+    if bio_data is None:
         return f"Biography {bio_id} not found for type {type_name}.", 404
-
-    bio_data = load_json_as_dict(bio_file)
     name = bio_data.get("name", "[Unknown]")
 
     # Initial defaults
@@ -1695,7 +2103,7 @@ def time_step(type_name, bio_id):
                 time_entry["subvalue"] = selected_subvalue
                 label_value = selected_subvalue
 
-            session["time_selection"] = {
+            time_selection = {
                 "label": label_value,
                 "confidence": confidence_value,
                 "label_type": selected_label_type,
@@ -1711,12 +2119,12 @@ def time_step(type_name, bio_id):
                 edit_index = session.get("entry_index")
 
             if edit_index is not None and 0 <= edit_index < len(bio_data["entries"]):
-                bio_data["entries"][edit_index]["time"] = session["time_selection"]
+                bio_data["entries"][edit_index]["time"] = time_selection
                 bio_data["entries"][edit_index]["created"] = datetime.now().isoformat()
                 session["entry_index"] = edit_index
             else:
                 new_entry = {
-                    "time": session["time_selection"],
+                    "time": time_selection,
                     "created": datetime.now().isoformat()
                 }
                 bio_data.setdefault("entries", []).append(new_entry)
@@ -1728,36 +2136,38 @@ def time_step(type_name, bio_id):
     # Load time label types (e.g. date.json, life_stage.json)
     label_files = []
     if os.path.exists(labels_folder):
-        for file in os.listdir(labels_folder):
-            full_path = os.path.join(labels_folder, file)
-            if file.endswith(".json") and os.path.isfile(full_path):
+        with os.scandir(labels_folder) as it:
+            for e in it:
+                if not e.name.endswith(".json") or not e.is_file():
+                    continue
                 try:
-                    with open(full_path) as f:
-                        data = json.load(f)
-                        label = os.path.splitext(file)[0]
-                        desc = data.get("description", "")
-                        label_files.append((label, desc))
-                except Exception as e:
-                    print(f"[ERROR] Failed to load label {file}: {e}")
+                    with open(e.path, "rb") as f:
+                        data = json_loads(f.read())
+                    label_files.append({"key": e.name[:-5], "desc": data.get("description", "")})
+                except Exception as ex:
+                    print(f"[ERROR] Failed to load label {e.name}: {ex}")
 
     # Load sublabels if applicable
     subfolder_labels = []
     if selected_label_type and selected_label_type != "date":
         subfolder_path = os.path.join(labels_folder, selected_label_type)
         if os.path.isdir(subfolder_path):
-            for f in os.listdir(subfolder_path):
-                if f.endswith(".json"):
+            with os.scandir(subfolder_path) as it:
+                for e in it:
+                    if not e.name.endswith(".json"):
+                        continue
                     try:
-                        with open(os.path.join(subfolder_path, f)) as sf:
-                            data = json.load(sf)
-                            subfolder_labels.append({
-                                "name": os.path.splitext(f)[0],
-                                "description": data.get("description", ""),
-                                "order": data.get("order", 999)
-                            })
-                    except Exception as e:
-                        print(f"[ERROR] Failed to load sublabel {f}: {e}")
-            subfolder_labels.sort(key=lambda x: (x.get("order", 999), x["name"]))
+                        with open(e.path, "rb") as sf:
+                            data = json_loads(sf.read())
+                        subfolder_labels.append({
+                            "name": e.name[:-5],
+                            "description": data.get("description", ""),
+                            "order": data.get("order", 999)
+                        })
+                    except Exception as ex:
+                        print(f"[ERROR] Failed to load sublabel {e.name}: {ex}")
+            # "order" is always filled in above, so a plain itemgetter key is enough
+            subfolder_labels.sort(key=itemgetter("order", "name"))
 
     # Format existing entries
     display_list = []
@@ -1767,7 +2177,7 @@ def time_step(type_name, bio_id):
         conf = time_info.get("confidence", "unknown")
         display_list.append((tag, conf))
 
-    return render_template(
+    return _render_hot(
         "time_step.html",
         type_name=type_name,
         bio_id=bio_id,
@@ -1791,7 +2201,7 @@ def type_labels(type_name):
     if not os.path.isdir(label_dir):
         return f"No labels folder for type '{type_name}'. Expected {label_dir}", 404
 
-    IMAGE_EXTS = [".jpg", ".jpeg", ".png", ".webp"]
+    IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp")
 
     def _is_mapping(x): return isinstance(x, dict)
 
@@ -1811,32 +2221,26 @@ def type_labels(type_name):
             print(f"[labels view] save error {p}: {e}")
             return False
 
-    def _sibling_image(folder, base):
-        for ext in IMAGE_EXTS:
-            cand = os.path.join(folder, base + ext)
-            if os.path.exists(cand):
-                rel = os.path.relpath(cand, ".").replace("\\", "/")
-                return "/" + rel
-        return None
-
-    def _folder_options_for(type_key, rel_path):
+    def _folder_options_for(type_key, rel_path, *, child_fetcher=None):
         """
         Return 1-level options for types/<type_key>/labels/<rel_path>/*.json
-        (ignores _group.json)
+        (ignores _group.json). child_fetcher(option_id) -> list attaches folder children.
         """
         out = []
-        base = os.path.join("types", type_key, "labels", *rel_path.split("/")) if rel_path else os.path.join("types", type_key, "labels")
+        base = os.path.join("types", type_key, "labels", *_key_segments(rel_path or ""))
         if not os.path.isdir(base):
             return out
-        for f in sorted(os.listdir(base)):
-            if not f.endswith(".json") or f == "_group.json":
-                continue
-            lid = os.path.splitext(f)[0]
-            jp = os.path.join(base, f)
-            data = _load_json(jp)
-            name = (data.get("properties", {}) or {}).get("name") or data.get("display") or data.get("name") or lid
-            desc = data.get("description") or (data.get("properties", {}) or {}).get("description", "") or ""
-            img = _sibling_image(os.path.dirname(jp), lid)
+        entries = _option_json_entries(base)
+        images = image_urls(base, IMAGE_EXTS, [e.name[:-5] for e in entries])
+        datas = _load_json_many([e.path for e in entries])
+        for e, data in zip(entries, datas):
+            data = data or {}
+            lid = e.name[:-5]
+            jp = e.path
+            props = data.get("properties") or _EMPTY
+            name = props.get("name") or data.get("display") or data.get("name") or lid
+            desc = data.get("description") or props.get("description", "") or ""
+            img = images.get(lid)
             opt = {
                 "id": lid,
                 "display": name,
@@ -1852,11 +2256,13 @@ def type_labels(type_name):
                     continue
                 kids.append({
                     "id": cid,
-                    "display": (k.get("display") or k.get("label") or cid.replace("_", " ").title()),
+                    "display": (k.get("display") or k.get("label") or _humanize(cid)),
                     "description": k.get("description", ""),
                     "image_url": k.get("image_url", ""),
                     "archived": bool(k.get("archived")),
                 })
+            if child_fetcher:
+                kids = child_fetcher(lid) or kids
             if kids:
                 opt["children"] = kids
                 opt["child_count"] = len(kids)
@@ -1865,63 +2271,55 @@ def type_labels(type_name):
 
     def _child_options_here(group_key, option_id):
         # types/<this>/labels/<group_key>/<option_id>/*.json
-        child_dir = os.path.join(label_dir, *group_key.split("/"), option_id)
-        rel = os.path.relpath(child_dir, os.path.join("types", type_name, "labels")).replace("\\", "/")
+        rel = f"{group_key}/{option_id}"
+        child_dir = os.path.join(label_dir, *_key_segments(rel))
         return _folder_options_for(type_name, rel) if os.path.isdir(child_dir) else []
 
     groups = []
 
-    # Cache list of top-level jsons
-    top_level_jsons = {
-        f for f in os.listdir(label_dir)
-        if f.endswith(".json") and os.path.isfile(os.path.join(label_dir, f))
-    }
+    # One pass over labels/: top-level jsons and group folders
+    with os.scandir(label_dir) as it:
+        top_entries = list(it)
+    top_level_jsons = {e.name for e in top_entries if e.name.endswith(".json") and e.is_file()}
+    folder_names = sorted(e.name for e in top_entries if e.is_dir())
 
     # ---------- 1) FOLDER GROUPS ----------
-    for entry in sorted(os.listdir(label_dir)):
-        full = os.path.join(label_dir, entry)
-        if not os.path.isdir(full):
-            continue
-
+    label_prefix = os.path.join(label_dir, "")
+    for entry in folder_names:
         # metadata from _group.json
-        meta_path = os.path.join(full, "_group.json")
+        meta_path = label_prefix + entry + os.sep + "_group.json"
         meta = _load_json(meta_path) if os.path.exists(meta_path) else {}
-        gname = meta.get("name") or (meta.get("properties", {}) or {}).get("name") or entry.replace("_", " ").title()
-        gdesc = meta.get("description") or (meta.get("properties", {}) or {}).get("description", "") or ""
+        props = meta.get("properties")
+        props = props if _is_mapping(props) else _EMPTY
+        gname = meta.get("name") or props.get("name") or _humanize(entry)
+        gdesc = meta.get("description") or props.get("description", "") or ""
         garch = bool(meta.get("archived"))
 
-        # options directly under this folder
-        options = _folder_options_for(type_name, entry)
-
-        # attach children one level deeper for each option (folder style)
-        enhanced = []
-        for opt in options:
-            kids = _child_options_here(entry, opt["id"])
-            if kids:
-                opt = dict(opt)
-                opt["children"] = kids
-                opt["child_count"] = len(kids)
-            enhanced.append(opt)
+        # options directly under this folder, with children one level deeper (folder style)
+        options = _folder_options_for(type_name, entry,
+                                      child_fetcher=lambda lid, entry=entry: _child_options_here(entry, lid))
 
         groups.append({
             "key": entry,
             "label": gname,
             "description": gdesc,
             "archived": garch,
-            "options": enhanced,
-            "count": len(enhanced),
+            "options": options,
+            "count": len(options),
             "kind": "folder"
         })
 
     # ---------- 2) PROPERTY/FILE GROUPS ----------
     for jf in sorted(top_level_jsons):
         prop_key = os.path.splitext(jf)[0]
-        prop_path = os.path.join(label_dir, jf)
+        prop_path = label_prefix + jf
         meta = _load_json(prop_path)
         if not _is_mapping(meta):
             continue
 
-        src = meta.get("source") or (meta.get("properties", {}) or {}).get("source") or {}
+        props = meta.get("properties")
+        props = props if _is_mapping(props) else _EMPTY
+        src = meta.get("source") or props.get("source") or _EMPTY
         is_mapping_source = _is_mapping(src)
         kind = src.get("kind") if is_mapping_source else None
 
@@ -1944,8 +2342,8 @@ def type_labels(type_name):
             target_type = src.get("type") or ""
             target_path = src.get("path") or prop_key
 
-        prop_name = meta.get("name") or (meta.get("properties", {}) or {}).get("name") or prop_key.replace("_", " ").title()
-        prop_desc = meta.get("description") or (meta.get("properties", {}) or {}).get("description", "") or ""
+        prop_name = meta.get("name") or props.get("name") or _humanize(prop_key)
+        prop_desc = meta.get("description") or props.get("description", "") or ""
         parch = bool(meta.get("archived"))
 
         options = []
@@ -1967,7 +2365,7 @@ def type_labels(type_name):
     # sort: folders first, then property links
     groups.sort(key=lambda g: (0 if g["kind"] == "folder" else 1, g["key"]))
 
-    return render_template("type_labels.html", type_name=type_name, groups=groups)
+    return _render_hot("type_labels.html", type_name=type_name, groups=groups)
 
 
 def _set_group_archived(type_name: str, group_key: str, *, archived: bool) -> bool:
@@ -1975,34 +2373,25 @@ def _set_group_archived(type_name: str, group_key: str, *, archived: bool) -> bo
     For a folder group: write types/<type>/labels/<group_key>/_group.json {archived: bool}
     For a file/property group: write types/<type>/labels/<group_key>.json {archived: bool}
     """
-    label_dir = os.path.join("types", type_name, "labels")
-    folder = os.path.join(label_dir, group_key)
-    filep  = os.path.join(label_dir, f"{group_key}.json")
+    # '/'-joined like the group keys themselves; fine on Windows too
+    label_dir = f"types/{type_name}/labels"
+    folder = f"{label_dir}/{group_key}"
+    filep  = f"{folder}.json"
 
     if os.path.isdir(folder):
-        meta_path = os.path.join(folder, "_group.json")
-        meta = load_json_as_dict(meta_path) if os.path.exists(meta_path) else {}
+        meta_path = f"{folder}/_group.json"
+        meta = _read_json(meta_path)
         if not isinstance(meta, dict):
             meta = {}
         meta["archived"] = bool(archived)
-        try:
-            save_dict_as_json(meta_path, meta)
-            return True
-        except Exception as e:
-            print("Archive folder group error:", e)
-            return False
+        return _write_json(meta_path, meta)
 
     if os.path.isfile(filep):
-        doc = load_json_as_dict(filep) or {}
+        doc = _read_json(filep)
         if not isinstance(doc, dict):
             doc = {}
         doc["archived"] = bool(archived)
-        try:
-            save_dict_as_json(filep, doc)
-            return True
-        except Exception as e:
-            print("Archive file group error:", e)
-            return False
+        return _write_json(filep, doc)
 
     return False
 
@@ -2035,32 +2424,13 @@ def api_unarchive_label_group(type_name):
 @app.route("/api/type/<type_name>/label_paths")
 def api_label_paths(type_name):
     base = os.path.join("types", type_name, "labels")
-    paths = set()
-    if os.path.isdir(base):
-        for root, dirs, files in os.walk(base):
-            rel = os.path.relpath(root, base)
-            if rel == ".":
-                continue
-            # Only folders that contain .jsons (options/groups)
-            has_json = any(f.endswith(".json") for f in files)
-            if has_json:
-                # normalise slashes
-                paths.add(rel.replace("\\", "/"))
-    return jsonify(sorted(paths))
+    # Only folders that contain .jsons (options/groups)
+    return _json_response(sorted(_dirs_with_json(base)))
 
 @app.route("/api/type/<type_name>/bio_paths")
 def api_bio_paths(type_name):
     base = os.path.join("types", type_name, "biographies")
-    paths = set()
-    if os.path.isdir(base):
-        for root, dirs, files in os.walk(base):
-            rel = os.path.relpath(root, base)
-            if rel == ".":
-                continue
-            has_json = any(f.endswith(".json") for f in files)
-            if has_json:
-                paths.add(rel.replace("\\", "/"))
-    return jsonify(sorted(paths))
+    return _json_response(sorted(_dirs_with_json(base)))
 
 @app.post("/api/time/admin/create_group")
 def api_time_admin_create_group():
@@ -2074,7 +2444,7 @@ def api_time_admin_create_group():
     desc_path = os.path.join(base, f"{key}.json")
     if os.path.exists(desc_path):
         return {"ok": False, "error": "group_exists"}, 409
-    data = {"label": (p.get("label") or key.replace("_"," ").title()),
+    data = {"label": (p.get("label") or _humanize(key)),
             "description": p.get("description",""), "order": int(p.get("order", 999))}
     _safe_json_write(desc_path, data)
     os.makedirs(os.path.join(base, key), exist_ok=True)
@@ -2097,7 +2467,7 @@ def api_time_admin_create_option():
         return {"ok": False, "error": "option_exists"}, 409
     data = {
         "id": opt_id,
-        "display": p.get("display") or opt_id.replace("_"," ").title(),
+        "display": p.get("display") or _humanize(opt_id),
         "description": p.get("description",""),
         "order": int(p.get("order", 999)),
         "start_iso": p.get("start_iso"),
@@ -2114,7 +2484,7 @@ def type_labels_api(type_name):
     if not os.path.isdir(base):
         return jsonify({"ok": False, "error": "not_found"}), 404
 
-    groups = collect_label_groups(base, type_name)
+    groups = _collect_label_groups_cached(base, type_name)
 
     # Build a convenience "labels" list for clients/tests.
     labels = []
@@ -2130,7 +2500,7 @@ def type_labels_api(type_name):
             **({"refer_to": g["refer_to"]} if "refer_to" in g else {})
         })
 
-    return jsonify({
+    return _json_response({
         "ok": True,
         "type": type_name,
         "groups": groups,
@@ -2298,6 +2668,7 @@ def api_ingest_apply(type_name, group_key):
             if f.endswith(".json"):
                 try: os.remove(os.path.join(opts_dir, f))
                 except Exception: pass
+        bump_cache_generation()
 
     # write option files
     wrote = 0
@@ -2330,12 +2701,9 @@ def general_iframe_wizard():
     type_name = q_type
     if not type_name and bio_id:
         try:
-            for t in list_types():
-                candidate = os.path.join("types", t, "biographies", f"{bio_id}.json")
-                if os.path.exists(candidate):
-                    data = load_json_as_dict(candidate) or {}
-                    type_name = data.get("type") or t
-                    break
+            t, candidate = find_bio_type(bio_id)
+            if candidate:
+                type_name = load_json_cached(candidate).get("type") or t
         except Exception:
             pass
 
@@ -2348,8 +2716,9 @@ def general_iframe_wizard():
 
     if bio_id and type_name:
         bio_file = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
-        if os.path.exists(bio_file):
-            bio = load_json_as_dict(bio_file) or {}
+        bio = _try_load_bio(bio_file)
+        if bio is not None:
+            bio = bio or {}
             entries = bio.get("entries") or []
 
             if add_flag:
@@ -2409,17 +2778,19 @@ def general_iframe_wizard():
             bio_dir = os.path.join("types", type_name, "biographies")
             os.makedirs(bio_dir, exist_ok=True)
 
-            slug_base = re.sub(r"[^a-zA-Z0-9_]+", "_", new_name).strip("_").lower() or "untitled"
+            slug_base = _slugify_type_name(new_name)
             slug = slug_base
             i = 2
-            while os.path.exists(os.path.join(bio_dir, f"{slug}.json")):
+            with os.scandir(bio_dir) as it:
+                existing = {e.name for e in it if e.name.endswith(".json")}
+            while f"{slug}.json" in existing:
                 slug = f"{slug_base}_{i}"
                 i += 1
 
             data = {
                 "id": slug,
-                "uid": uuid.uuid4().hex,
-                "name": new_name or slug.replace("_", " ").title(),
+                "uid": secrets.token_hex(16),
+                "name": new_name or _humanize(slug),
                 "type": type_name,
                 "created": now_iso_utc(),
                 "updated": now_iso_utc(),
@@ -2438,7 +2809,7 @@ def general_iframe_wizard():
         types = list_types()
         # If a type is preselected, only load those bios (faster page)
         filtered_bios = list_biographies(type_name) if type_name else []
-        return render_template(
+        return _render_hot(
             "general_step_start.html",
             types=types,
             preselected_type=type_name or "",
@@ -2450,7 +2821,7 @@ def general_iframe_wizard():
         flash("Type is missing for this wizard session.", "error")
         return redirect(url_for("general_iframe_wizard", step="start"))
 
-    return render_template(
+    return _render_hot(
         "general_iframe_wizard.html",
         type_name=type_name,
         bio_id=bio_id,
@@ -2497,28 +2868,13 @@ def api_bios_folders():
 
     return jsonify(ok=True, items=items)
 
-# UPDATED
-@app.route("/api/bios/list")
-def api_bios_list():
-    type_name = (request.args.get("type") or "").strip()
-    if not type_name:
-        return jsonify(ok=False, error="Missing type"), 400
+# (type, folder, recursive) -> [(generation, root mtime_ns), [(hay, item)], default reply bytes or None]
+_BIOS_LIST_CACHE: dict = {}
+_BIOS_LIST_LIMIT = 500
 
-    # NEW: folder filtering
-    folder    = (request.args.get("folder") or "").strip().strip("/")
-    recursive = (request.args.get("recursive", "0").lower() in ("1","true","yes"))
-    q         = (request.args.get("q") or "").strip().lower()
-    limit     = int(request.args.get("limit") or "500")
-
-    base = os.path.join("types", type_name, "biographies")
-    if not os.path.isdir(base):
-        return jsonify(ok=True, items=[])
-
-    search_root = os.path.join(base, folder) if folder else base
-    if not os.path.isdir(search_root):
-        return jsonify(ok=True, items=[])
-
-    items = []
+def _bios_list_entries(base: str, search_root: str, recursive: bool) -> list:
+    """Every bio under search_root as (search haystack, item), sorted by name."""
+    entries = []
 
     def _add(file_path: str):
         if os.path.basename(file_path) == "_group.json": return
@@ -2531,19 +2887,15 @@ def api_bios_list():
         except Exception:
             data = {}
 
-        name = data.get("name") or stem.replace("_"," ").title()
+        name = data.get("name") or _humanize(stem)
         key  = rel[:-5].replace(os.sep, "/")           # e.g. "educational_buildings/red_primary_school"
 
-        hay = f"{name} {stem} {key}".lower()
-        if q and q not in hay:
-            return
-
-        items.append({
+        entries.append((f"{name} {stem} {key}".lower(), {
             "id": stem,                     # legacy (file stem)
             "name": name,
             "key": key,                     # <folder>/<stem>
             "path": rel.replace(os.sep, "/")
-        })
+        }))
 
     if recursive:
         for root, _, files in os.walk(search_root):
@@ -2553,8 +2905,54 @@ def api_bios_list():
         for fn in os.listdir(search_root):
             _add(os.path.join(search_root, fn))
 
-    items.sort(key=lambda x: x["name"].lower())
-    return jsonify(ok=True, items=items[:limit])
+    entries.sort(key=lambda e: e[1]["name"].lower())
+    return entries
+
+# UPDATED
+@app.route("/api/bios/list")
+def api_bios_list():
+    type_name = (request.args.get("type") or "").strip()
+    if not type_name:
+        return jsonify(ok=False, error="Missing type"), 400
+
+    # NEW: folder filtering
+    folder    = (request.args.get("folder") or "").strip().strip("/")
+    recursive = (request.args.get("recursive", "0").lower() in ("1","true","yes"))
+    q         = (request.args.get("q") or "").strip().lower()
+    limit     = int(request.args.get("limit") or _BIOS_LIST_LIMIT)
+
+    base = os.path.join("types", type_name, "biographies")
+    if not os.path.isdir(base):
+        return jsonify(ok=True, items=[])
+
+    search_root = os.path.join(base, folder) if folder else base
+    try:
+        stamp = (cache_generation(), os.stat(search_root).st_mtime_ns)
+    except OSError:
+        return jsonify(ok=True, items=[])
+    if not os.path.isdir(search_root):
+        return jsonify(ok=True, items=[])
+
+    # Unchanged folder: reuse the parsed listing (and, for the default request, the encoded reply).
+    # Saves made through the app bump the generation, which covers nested edits too.
+    ck = (type_name, folder, recursive)
+    hit = _BIOS_LIST_CACHE.get(ck)
+    if hit is None or hit[0] != stamp:
+        hit = [stamp, _bios_list_entries(base, search_root, recursive), None]
+        _BIOS_LIST_CACHE[ck] = hit
+    entries = hit[1]
+
+    if q:
+        items = [item for hay, item in entries if q in hay]
+        return jsonify(ok=True, items=items[:limit])
+    if limit != _BIOS_LIST_LIMIT:
+        # only the default page is kept encoded, so the client can't grow the cache
+        return jsonify(ok=True, items=[item for _, item in entries[:limit]])
+
+    if hit[2] is None:
+        # same bytes jsonify() would send, encoded once
+        hit[2] = jsonify(ok=True, items=[item for _, item in entries[:limit]]).get_data()
+    return Response(hit[2], mimetype=app.json.mimetype)
 
 def _time_labels_root_for(type_name: str) -> str:
     # 1) per-type override, else 2) global
@@ -2563,12 +2961,6 @@ def _time_labels_root_for(type_name: str) -> str:
         return p1
     return os.path.join("types", "time", "labels")
 
-def _read_json(path: str) -> dict:
-    try:
-        return load_json_as_dict(path) or {}
-    except Exception:
-        return {}
-
 def load_time_catalog(type_name: str) -> dict:
     """
     Returns a dict:
@@ -2583,52 +2975,87 @@ def load_time_catalog(type_name: str) -> dict:
     cats = []
     opts = {}
 
-    # categories = all *.json at root
-    for f in os.listdir(root):
-        if not f.endswith(".json"):
-            continue
-        key = os.path.splitext(f)[0]
-        meta = _read_json(os.path.join(root, f))
+    # categories = all *.json at root; option folders come from the same directory read
+    with os.scandir(root) as it:
+        top = list(it)
+    cat_entries = [e for e in top if e.name.endswith(".json")]
+    subdirs = {e.name for e in top if e.is_dir(follow_symlinks=False)}
+
+    # options by subfolder
+    opt_entries = {}
+    for e in cat_entries:
+        cat = e.name[:-5]
+        if cat in subdirs:
+            with os.scandir(os.path.join(root, cat)) as it:
+                opt_entries[cat] = [g for g in it if g.name.endswith(".json")]
+
+    # parse every file in one batch (concurrently once there are enough of them)
+    paths = [e.path for e in cat_entries]
+    for entries in opt_entries.values():
+        paths.extend(g.path for g in entries)
+    metas = iter(_load_json_many(paths))
+
+    for e in cat_entries:
+        meta = next(metas) or {}
         cats.append({
-            "key": key,
+            "key": e.name[:-5],
             "description": meta.get("description", ""),
             "order": meta.get("order", 999)
         })
 
-    # options by subfolder
-    for cat in [c["key"] for c in cats]:
-        subdir = os.path.join(root, cat)
-        if os.path.isdir(subdir):
-            arr = []
-            for g in os.listdir(subdir):
-                if g.endswith(".json"):
-                    j = _read_json(os.path.join(subdir, g))
-                    arr.append({
-                        "id": os.path.splitext(g)[0],
-                        "display": j.get("display") or os.path.splitext(g)[0].replace("_"," ").title(),
-                        "description": j.get("description", ""),
-                        "order": j.get("order", 999),
-                        # pass through optional bounds for normaliser
-                        "start_iso": j.get("start_iso"),
-                        "end_iso": j.get("end_iso"),
-                        "image": j.get("image") or j.get("image_url")
-                    })
-            arr.sort(key=lambda x: (x.get("order", 999), x["display"]))
-            opts[cat] = arr
+    for cat, entries in opt_entries.items():
+        arr = []
+        for g in entries:
+            j = next(metas) or {}
+            gid = g.name[:-5]
+            arr.append({
+                "id": gid,
+                "display": j.get("display") or _humanize(gid),
+                "description": j.get("description", ""),
+                "order": j.get("order", 999),
+                # pass through optional bounds for normaliser
+                "start_iso": j.get("start_iso"),
+                "end_iso": j.get("end_iso"),
+                "image": j.get("image") or j.get("image_url")
+            })
+        arr.sort(key=lambda x: (x.get("order", 999), x["display"]))
+        opts[cat] = arr
 
     cats.sort(key=lambda x: (x.get("order", 999), x["key"]))
     return {"categories": cats, "options": opts}
 
+@lru_cache(maxsize=16)
+def _load_time_catalog_at(type_name: str, stamp) -> dict:
+    return load_time_catalog(type_name)
+
+def _load_time_catalog_cached(type_name: str) -> dict:
+    """load_time_catalog memoised until the next write (or a few seconds). Treat as read-only."""
+    return _load_time_catalog_at(type_name, _types_tree_stamp())
+
+
+def _format_tag(t: dict) -> str:
+    """Short tag for one entry's time block in the time step's existing-entries list."""
+    date_value = t.get("date_value")
+    if date_value and t.get("label_type") == "dob":
+        return "DOB: " + date_value
+    if t.get("subvalue"):
+        return t["subvalue"]
+    if date_value:
+        return date_value
+    start, end = t.get("start_date", ""), t.get("end_date", "")
+    if start or end:
+        return (start + ".." + end).strip(".") or "[unspecified]"
+    return "[unspecified]"
 
 @app.route("/general_step/time/<type_name>/<bio_id>", methods=["GET", "POST"])
 def general_step_time(type_name, bio_id):
     labels_root = _time_labels_root_for(type_name)
     bio_file = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
     os.makedirs(labels_root, exist_ok=True)
-    if not os.path.exists(bio_file):
+    bio_data = _try_load_bio(bio_file)
+    if bio_data is None:
         return f"Biography {bio_id} not found.", 404
-
-    bio_data = load_json_as_dict(bio_file) or {}
+    bio_data = bio_data or {}
     bio_data.setdefault("entries", [])
 
     def _as_int(x, default=None):
@@ -2715,26 +3142,18 @@ def general_step_time(type_name, bio_id):
                 raw["subvalue"] = selected_subvalue
                 label_value = selected_subvalue
 
-            # Option metadata for normaliser
-            catalog = load_time_catalog(type_name)
+            # Option metadata for normaliser (date/dob/range carry no option to look up)
             opt_meta = None
-            if selected_label_type in catalog.get("options", {}):
-                for o in catalog["options"][selected_label_type]:
-                    if o["id"] == selected_subvalue:
-                        opt_meta = o
-                        break
+            if selected_label_type not in ("date", "dob", "range"):
+                catalog = _load_time_catalog_cached(type_name)
+                # option ids are file names, so unique within a category
+                by_id = {o["id"]: o for o in catalog.get("options", {}).get(selected_label_type, [])}
+                opt_meta = by_id.get(selected_subvalue)
 
             try:
-                from time_utils import normalise_time_for_bio_entry
+                normalised = normalise_time_for_bio_entry(raw, biography=bio_data, option_meta=opt_meta)
             except Exception:
-                normalise_time_for_bio_entry = None
-
-            normalised = {}
-            if normalise_time_for_bio_entry:
-                try:
-                    normalised = normalise_time_for_bio_entry(raw, biography=bio_data, option_meta=opt_meta)
-                except Exception:
-                    normalised = {}
+                normalised = {}
 
             now_iso = datetime.now(timezone.utc).isoformat()
 
@@ -2761,22 +3180,12 @@ def general_step_time(type_name, bio_id):
             if selected_label_type == "dob" and selected_date:
                 bio_data["dob"] = selected_date
 
-            # compact selection for Labels header
-            session["time_selection"] = {
-                "label": label_value,
-                "confidence": conf_val,
-                "label_type": selected_label_type,
-                "date_value": selected_date if selected_label_type in ("date", "dob") else "",
-                "subvalue":   selected_subvalue if selected_label_type not in ("date", "dob", "range") else "",
-                "start_date": selected_start if selected_label_type == "range" else "",
-                "end_date":   selected_end if selected_label_type == "range" else "",
-            }
-
+            # the Labels header summary is rebuilt from entry["time"] (_time_selection_for)
             save_dict_as_json(bio_file, bio_data)
             return redirect(url_for("general_iframe_wizard", type=type_name, bio_id=bio_id, step="labels"))
 
     # ---------- build template data ----------
-    catalog = load_time_catalog(type_name)
+    catalog = _load_time_catalog_cached(type_name)
     label_files = [{"key": c["key"], "desc": c.get("description", "")} for c in catalog["categories"]]
 
     subfolder_labels = []
@@ -2789,21 +3198,12 @@ def general_step_time(type_name, bio_id):
             })
         subfolder_labels.sort(key=lambda x: (x.get("order", 999), x["name"]))
 
-    display_list = []
-    for ent in bio_data.get("entries", []):
-        t = ent.get("time", {}) or {}
-        tag = (
-            ("DOB: " + t.get("date_value")) if (t.get("label_type") == "dob" and t.get("date_value"))
-            else t.get("subvalue")
-            or t.get("date_value")
-            or (t.get("start_date", "") + ".." + t.get("end_date", "")).strip(".")
-        )
-        conf = t.get("confidence", "unknown")
-        display_list.append((tag or "[unspecified]", conf))
+    times = [ent.get("time") or {} for ent in bio_data.get("entries", [])]
+    display_list = [(_format_tag(t), t.get("confidence", "unknown")) for t in times]
 
     selected_confidence = selected_confidence or "100"
 
-    return render_template(
+    return _render_hot(
         "time_step.html",
         type_name=type_name,
         bio_id=bio_id,
@@ -2839,10 +3239,10 @@ def general_step_labels(type_name, bio_id):
     label_base_path = os.path.join("types", type_name, "labels")
     bio_file_path   = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
     os.makedirs(label_base_path, exist_ok=True)
-    if not os.path.exists(bio_file_path):
+    bio_data = _try_load_bio(bio_file_path)
+    if bio_data is None:
         return f"Biography file {bio_id} not found for type {type_name}.", 404
-
-    bio_data = load_json_as_dict(bio_file_path) or {}
+    bio_data = bio_data or {}
     bio_data.setdefault("entries", [])
 
     # --- helpers (local) ---
@@ -2852,16 +3252,6 @@ def general_step_labels(type_name, bio_id):
         except (TypeError, ValueError):
             return default
 
-    def _build_option_index(groups: List[Dict]) -> Dict[str, str]:
-        idx: Dict[str, str] = {}
-        for g in groups or []:
-            gkey = g.get("key")
-            for opt in g.get("options", []) or []:
-                oid = opt.get("id")
-                if oid and gkey:
-                    idx[str(oid)] = gkey  # map option-id -> group.key
-        return idx
-
     def _validate_input_group(g: dict, value: str) -> Optional[str]:
         # normalise input block
         inp = (g or {}).get("input")
@@ -2895,8 +3285,7 @@ def general_step_labels(type_name, bio_id):
         patt = inp.get("pattern")
         if isinstance(patt, str) and patt:
             try:
-                import re
-                if not re.fullmatch(patt, val):
+                if not _compiled_pattern(patt).fullmatch(val):
                     return "Format is invalid."
             except re.error:
                 # ignore bad patterns rather than bombing
@@ -2909,8 +3298,6 @@ def general_step_labels(type_name, bio_id):
     if entry_index is None or not (0 <= entry_index < len(bio_data["entries"])):
         now = datetime.now(timezone.utc).isoformat()
         new_entry = {"created": now, "updated": now}
-        if session.get("time_selection"):
-            new_entry["time"] = session["time_selection"]
         new_entry[type_name] = []
         bio_data["entries"].append(new_entry)
         entry_index = len(bio_data["entries"]) - 1
@@ -2920,12 +3307,13 @@ def general_step_labels(type_name, bio_id):
     bio_data["entries"][entry_index].setdefault(type_name, [])
 
     # -------- build base groups --------
-    base_groups = _collect_label_groups(label_base_path, type_name)
-    base_index  = _build_option_index(base_groups)
+    group_cache = _cached_groups(label_base_path, type_name, _collect_label_groups)
+    base_groups, _, base_index = group_cache
 
-    # -------- map saved selections -> existing_labels (initial) --------
-    existing_labels: Dict[str, dict] = {}
+    # -------- map saved selections -> selected_map (initial) --------
+    # saved items parsed once: (label_type, id, payload)
     saved_items = bio_data["entries"][entry_index].get(type_name, [])
+    normalized = []
     for it in saved_items:
         lt  = (it.get("label_type") or "").strip()
         lid = (it.get("id") or "").strip()
@@ -2933,48 +3321,35 @@ def general_step_labels(type_name, bio_id):
         if lid:
             payload["label"] = lid
             payload["id"] = lid
+        normalized.append((lt, lid, payload))
+
+    # group key -> selected option id, keyed by the base index (a later id-less item clears it)
+    selected_map: Dict[str, str] = {}
+    for lt, lid, _payload in normalized:
         key = base_index.get(lid) or lt
-        if key:
-            existing_labels[key] = payload
+        if not key:
+            continue
+        if lid:
+            selected_map[key] = lid
+        else:
+            selected_map.pop(key, None)
 
     # -------- preview overlay --------
     preview_key = (request.args.get("preview_key") or "").strip()
     preview_val = (request.args.get("preview_val") or "").strip()
-    display_labels = dict(existing_labels)
     if preview_key and preview_val:
-        display_labels[preview_key] = {
-            "label": preview_val, "id": preview_val, "confidence": 100, "source": "preview"
-        }
+        selected_map[preview_key] = preview_val
 
     # -------- expand child groups (recurses) --------
-    selected_map = {}
-    for k, v in display_labels.items():
-        if isinstance(v, dict):
-            sel = v.get("label") or v.get("id")
-            if sel:
-                selected_map[k] = sel
-
     try:
-        expanded_groups = expand_child_groups(
-            base_groups=base_groups,
-            current_type=type_name,
-            label_base_path=label_base_path,
-            existing_labels=selected_map,
-        )
+        expanded_groups, expanded_index = _expanded_groups(group_cache, type_name, label_base_path, selected_map)
     except Exception as e:
         print(f"[WARN] expand_child_groups failed: {e}")
-        expanded_groups = base_groups
+        expanded_groups, expanded_index = base_groups, base_index
 
     # ---- rebuild existing_labels using expanded index
-    expanded_index = _build_option_index(expanded_groups)
     rebuilt_existing: Dict[str, dict] = {}
-    for it in saved_items:
-        lt  = (it.get("label_type") or "").strip()
-        lid = (it.get("id") or "").strip()
-        payload = {"confidence": it.get("confidence", 100), "source": it.get("source", "")}
-        if lid:
-            payload["label"] = lid
-            payload["id"] = lid
+    for lt, lid, payload in normalized:
         key = expanded_index.get(lid) or lt
         if key:
             rebuilt_existing[key] = payload
@@ -3004,7 +3379,7 @@ def general_step_labels(type_name, bio_id):
                 except Exception:
                     data = {}
                 bid = (data.get("id") or os.path.splitext(f)[0]).strip()
-                disp = (data.get("name") or data.get("display") or bid.replace("_", " ").title()).strip()
+                disp = (data.get("name") or data.get("display") or _humanize(bid)).strip()
                 desc = (data.get("description") or "").strip()
                 if bid:
                     item = {"id": bid, "display": disp}
@@ -3143,12 +3518,7 @@ def general_step_labels(type_name, bio_id):
             if val:
                 submitted_selections[gkey] = val
         try:
-            expanded_groups = expand_child_groups(
-                base_groups=base_groups,
-                current_type=type_name,
-                label_base_path=label_base_path,
-                existing_labels=submitted_selections,
-            )
+            expanded_groups, _ = _expanded_groups(group_cache, type_name, label_base_path, submitted_selections)
         except Exception as e:
             print(f"[WARN] expand_child_groups (POST) failed: {e}")
             # keep previously computed expanded_groups
@@ -3189,7 +3559,7 @@ def general_step_labels(type_name, bio_id):
                 continue
 
             conf_raw = (request.form.get(f"confidence_{key}") or "").strip()
-            conf = int(conf_raw) if conf_raw.isdigit() else 100
+            conf = _parse_conf(conf_raw)
 
             # input-group
             if g.get("input"):
@@ -3226,7 +3596,7 @@ def general_step_labels(type_name, bio_id):
             sel_id = (request.form.get(f"selected_id_{key}") or "").strip()
             sel_bio = (request.form.get(f"selected_id_{key}_bio") or "").strip()
             bio_conf_raw = (request.form.get(f"confidence_{key}_bio") or "").strip()
-            bio_conf = int(bio_conf_raw) if bio_conf_raw.isdigit() else 100
+            bio_conf = _parse_conf(bio_conf_raw)
 
             if sel_id or sel_bio:
                 entry = {"label_type": key.split("/")[-1], "confidence": conf}
@@ -3240,12 +3610,12 @@ def general_step_labels(type_name, bio_id):
         bio_data["entries"][entry_index][type_name] = new_entries
         bio_data["entries"][entry_index]["updated"] = datetime.now(timezone.utc).isoformat()
         bio_data["updated"] = bio_data["entries"][entry_index]["updated"]
-        save_dict_as_json(bio_file_path, bio_data)
+        save_dict_as_json_later(bio_file_path, bio_data)
 
         next_step = (request.form.get("next_step")
                      or request.args.get("next")
                      or "events").strip().lower()
-        if next_step not in {"start", "time", "labels", "events", "review"}:
+        if next_step not in _WIZARD_STEPS:
             next_step = "events"
 
         # ✅ NEW: preserve ?embed=1 (or whatever value) on the redirect
@@ -3304,7 +3674,7 @@ def general_step_labels(type_name, bio_id):
         linkable_bios=linkable_bios,                # fallback only
         step=0, next_step=1, prev_step=None,
         bio_id=bio_id,
-        time_selection=session.get("time_selection"),
+        time_selection=_time_selection_for(bio_data["entries"][entry_index]),
         bio_name=bio_data.get("name", bio_id),
         skip_allowed=(len(expanded_groups) == 0),
         ui_limit_labels=UI_LIMIT_LABELS,
@@ -3328,7 +3698,7 @@ def _collect_label_groups(label_base_path: str, type_name: str) -> List[dict]:
         path = os.path.join(label_base_path, fn)
         meta = load_json_as_dict(path) or {}
         key  = meta.get("key") or os.path.splitext(fn)[0]
-        label = meta.get("label") or key.replace("_", " ").title()
+        label = meta.get("label") or _humanize(key)
 
         if isinstance(meta.get("link_biography"), dict) and not meta.get("refer_to"):
             meta["refer_to"] = dict(meta["link_biography"])
@@ -3353,21 +3723,23 @@ def _collect_label_groups(label_base_path: str, type_name: str) -> List[dict]:
 
 def _options_from_dir(t: str, k: str) -> list:
     """Read options from: types/<t>/labels/<k>/*.json; preserve images/desc/children/refer_to/order."""
-    base = os.path.join("types", t, "labels", k)
+    base = os.path.join(_type_paths(t)[1], k)
     if not os.path.isdir(base):
         return []
     out = []
-    for fn in sorted(os.listdir(base)):
-        if not fn.endswith(".json") or fn == "_group.json":
+    images = image_urls(base)
+    for entry in sorted(cached_scandir(base), key=attrgetter("name")):
+        fn = entry.name
+        if not fn.endswith(".json") or fn == "_group.json" or not entry.is_file():
             continue
-        data = load_json_as_dict(os.path.join(base, fn)) or {}
+        data = load_json_cached(entry.path) or {}
         oid  = (data.get("id") or os.path.splitext(fn)[0]).strip()
         if not oid:
             continue
         opt = {
             "id": oid,
             "display": (data.get("display") or data.get("label") or data.get("name")
-                        or oid.replace("_", " ").title()),
+                        or _humanize(oid)),
         }
         if data.get("description"):  opt["description"]  = data["description"]
         # prefer explicit image fields, otherwise look for sibling file
@@ -3376,7 +3748,7 @@ def _options_from_dir(t: str, k: str) -> list:
         elif data.get("image_url"):
             opt["image_url"] = data["image_url"]
         else:
-            img = _sibling_image(base, oid)
+            img = images.get(oid)
             if img: opt["image"] = img
 
         if isinstance(data.get("children"), list): opt["children"] = data["children"]
@@ -3388,12 +3760,14 @@ def _options_from_dir(t: str, k: str) -> list:
 
 def _options_from_file(t: str, k: str) -> list:
     """Read options from meta file: types/<t>/labels/<k>.json; preserve images/desc/children/refer_to/order."""
-    jf = os.path.join("types", t, "labels", f"{k}.json")
+    labels_dir = _type_paths(t)[1]
+    jf = os.path.join(labels_dir, f"{k}.json")
     if not os.path.isfile(jf):
         return []
-    meta = load_json_as_dict(jf) or {}
+    meta = load_json_cached(jf) or {}
     raw  = meta.get("options") or []
-    base_folder = os.path.join("types", t, "labels", k)  # where sibling images would live
+    base_folder = os.path.join(labels_dir, k)  # where sibling images would live
+    images = image_urls(base_folder)
     out  = []
     for item in raw:
         if not isinstance(item, dict):
@@ -3404,7 +3778,7 @@ def _options_from_file(t: str, k: str) -> list:
         opt = {
             "id": oid,
             "display": (item.get("display") or item.get("label") or item.get("name")
-                        or oid.replace("_", " ").title()),
+                        or _humanize(oid)),
         }
         if item.get("description"):  opt["description"]  = item["description"]
         if item.get("image"):
@@ -3412,7 +3786,7 @@ def _options_from_file(t: str, k: str) -> list:
         elif item.get("image_url"):
             opt["image_url"] = item["image_url"]
         else:
-            img = _sibling_image(base_folder, oid)
+            img = images.get(oid)
             if img: opt["image"] = img
 
         if isinstance(item.get("children"), list): opt["children"] = item["children"]
@@ -3450,9 +3824,13 @@ def _merge_option_lists(*lists: list) -> list:
         for o in lst:
             oid = o.get("id") or o.get("key")
             if not oid: continue
-            out[oid] = better(out.get(oid), o)
+            seen_opt = out.get(oid)
+            # first sighting is just a copy; only real collisions need the field merge
+            out[oid] = dict(o) if seen_opt is None else better(seen_opt, o)
 
     items = list(out.values())
+    if len(items) <= 1:
+        return items
     items.sort(key=lambda x: (
         x.get("order", 999),
         (x.get("display") or x.get("id") or "").lower(),
@@ -3461,6 +3839,22 @@ def _merge_option_lists(*lists: list) -> list:
     return items
 
 
+def _request_memo(name: str) -> dict:
+    """Memo dict that lives for the current request (on flask.g); a throwaway {} outside one."""
+    if not has_app_context():
+        return {}
+    return g.setdefault(name, {})
+
+
+def _options_from_both(t: str, k: str) -> list:
+    """Folder + meta-file options for types/<t>/labels/<k>, merged; memoised per request."""
+    memo = _request_memo("_options_from_both")
+    hit = memo.get((t, k))
+    if hit is None:
+        hit = memo[(t, k)] = _merge_option_lists(_options_from_dir(t, k), _options_from_file(t, k))
+    return hit
+
+
 def _resolve_group_options(scope_t: str, meta: dict, *, group_key: str, collection_type: str = "events") -> list:
     """
     Merge option sources:
@@ -3472,12 +3866,19 @@ def _resolve_group_options(scope_t: str, meta: dict, *, group_key: str, collecti
     if not isinstance(meta, dict):
         meta = {}
 
+    # same inputs within one request -> same answer; meta is held in the entry so its id() stays unique
+    memo = _request_memo("_resolve_group_options")
+    ck = (scope_t, group_key, collection_type, id(meta))
+    hit = memo.get(ck)
+    if hit is not None:
+        return list(hit[1])
+
     candidate_lists = []
 
     # literal list
     lit = meta.get("options")
     if isinstance(lit, list) and lit:
-        candidate_lists.append(lit)
+        candidate_lists.append(_merge_option_lists(lit))  # dedupe/sort like the other sources
 
     # explicit source
     src = meta.get("source") or {}
@@ -3488,31 +3889,36 @@ def _resolve_group_options(scope_t: str, meta: dict, *, group_key: str, collecti
         if kind in ("type_labels", "self_labels"):
             t = (src.get("type") or (scope_t if kind == "self_labels" else "")).strip()
             k = (src.get("path") or "").strip()
-            candidate_lists.append(_merge_option_lists(_options_from_dir(t, k), _options_from_file(t, k)))
+            candidate_lists.append(_options_from_both(t, k))
 
         if plain == "labels":
             t = (src.get("type") or "").strip()
             k = (src.get("path") or "").strip()
-            candidate_lists.append(_merge_option_lists(_options_from_dir(t, k), _options_from_file(t, k)))
+            candidate_lists.append(_options_from_both(t, k))
 
     # refer_to / link_biography → labels
     ref = meta.get("refer_to") or meta.get("link_biography") or {}
     if isinstance(ref, dict) and (ref.get("source") == "labels"):
         t = (ref.get("type") or "").strip()
         k = (ref.get("path") or "").strip()
-        candidate_lists.append(_merge_option_lists(_options_from_dir(t, k), _options_from_file(t, k)))
+        candidate_lists.append(_options_from_both(t, k))
 
     # safety nets
     if group_key:
-        candidate_lists.append(_merge_option_lists(_options_from_dir(collection_type, group_key),
-                                                  _options_from_file(collection_type, group_key)))
-        candidate_lists.append(_merge_option_lists(_options_from_dir(scope_t, group_key),
-                                                  _options_from_file(scope_t, group_key)))
-
-    merged = []
-    for lst in candidate_lists:
-        merged = _merge_option_lists(merged, lst)
-    return merged
+        candidate_lists.append(_options_from_both(collection_type, group_key))
+        candidate_lists.append(_options_from_both(scope_t, group_key))
+
+    # every candidate is already a merged (deduped, sorted) list, so a lone source
+    # only needs the per-option copies the merge would have made
+    candidate_lists = [lst for lst in candidate_lists if lst]
+    if len(candidate_lists) > 1:
+        merged = _merge_option_lists(*candidate_lists)
+    elif candidate_lists:
+        merged = [dict(o) for o in candidate_lists[0]]
+    else:
+        merged = []
+    memo[ck] = (meta, merged)
+    return list(merged)
 
 
 # --- compatibility shim so older calls still work (e.g. Events step) ---
@@ -3546,7 +3952,7 @@ def _list_biographies(type_name: str) -> List[dict]:
         except Exception:
             data = {}
         bid = (data.get("id") or os.path.splitext(fn)[0]).strip()
-        disp = (data.get("name") or data.get("display") or bid.replace("_"," ").title()).strip()
+        disp = (data.get("name") or data.get("display") or _humanize(bid)).strip()
         desc = (data.get("description") or "").strip()
         if bid:
             item = {"id": bid, "display": disp}
@@ -3584,26 +3990,29 @@ def _load_time_kinds_and_options():
     if not os.path.isdir(base):
         return time_kinds, options_by_key
 
-    for fn in sorted(os.listdir(base)):
-        if not fn.endswith(".json"):
+    entries = sorted(cached_scandir(base), key=attrgetter("name"))
+    folders = {e.name for e in entries if e.is_dir()}
+    for entry in entries:
+        fn = entry.name
+        if not fn.endswith(".json") or not entry.is_file():
             continue
 
         key = os.path.splitext(fn)[0]  # e.g., "life_stage", "date", "range"
-        data = load_json_as_dict(os.path.join(base, fn)) or {}
-        desc = (data.get("description") or data.get("label") or key.replace("_", " ").title()).strip()
+        data = load_json_cached(entry.path) or {}
+        desc = (data.get("description") or data.get("label") or _humanize(key)).strip()
 
-        has_folder = os.path.isdir(os.path.join(base, key))
+        has_folder = key in folders
         time_kinds.append({"key": key, "desc": desc, "has_folder": has_folder})
 
         if has_folder:
-            folder = os.path.join(base, key)
             opts = []
-            for cf in sorted(os.listdir(folder)):
-                if not cf.endswith(".json"):
+            for child in sorted(cached_scandir(os.path.join(base, key)), key=attrgetter("name")):
+                cf = child.name
+                if not cf.endswith(".json") or not child.is_file():
                     continue
-                item = load_json_as_dict(os.path.join(folder, cf)) or {}
+                item = load_json_cached(child.path) or {}
                 oid  = (item.get("id") or os.path.splitext(cf)[0]).strip()
-                disp = (item.get("display") or item.get("label") or oid.replace("_"," ").title()).strip()
+                disp = (item.get("display") or item.get("label") or _humanize(oid)).strip()
                 if oid:
                     opts.append({"id": oid, "display": disp})
             options_by_key[key] = opts
@@ -3616,12 +4025,13 @@ def _list_event_groups() -> list:
     if not os.path.isdir(base):
         return []
     out = []
-    for fn in os.listdir(base):
-        if not fn.endswith(".json"):
+    for entry in cached_scandir(base):
+        fn = entry.name
+        if not fn.endswith(".json") or not entry.is_file():
             continue
-        data = load_json_as_dict(os.path.join(base, fn)) or {}
+        data = load_json_cached(entry.path) or {}
         key = data.get("key") or os.path.splitext(fn)[0]
-        label = data.get("label") or key.replace("_", " ").title()
+        label = data.get("label") or _humanize(key)
         out.append({
             "key": key,
             "label": label,
@@ -3633,7 +4043,7 @@ def _list_event_groups() -> list:
 
 @app.route("/general_step/events/<type_name>/<bio_id>", methods=["GET", "POST"])
 def general_step_events(type_name, bio_id):
-    bio_path = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
+    bio_path = os.path.join(_type_paths(type_name)[2], f"{bio_id}.json")
     if not os.path.exists(bio_path):
         return f"Biography {bio_id} not found for {type_name}.", 404
 
@@ -3653,8 +4063,12 @@ def general_step_events(type_name, bio_id):
     if not incoming_group and groups:
         incoming_group = groups[0]["key"]
 
+    groups_by_key = {}
+    for g in groups:
+        groups_by_key.setdefault(g["key"], g)  # first group wins, as the old scan did
+
     group_key  = incoming_group
-    group_meta = next((g["meta"] for g in groups if g["key"] == group_key), {}) if group_key else {}
+    group_meta = groups_by_key[group_key]["meta"] if group_key in groups_by_key else {}
 
     # ---- Build options_raw EARLY (merged from all sources) ----
     options_raw = _resolve_group_options(
@@ -3668,7 +4082,8 @@ def general_step_events(type_name, bio_id):
     chosen_option_id = (request.form.get("option_id") or "").strip()
     refer_to_type = ""
     if chosen_option_id:
-        opt = next((o for o in options_raw if o.get("id") == chosen_option_id), None)
+        options_by_id = {o["id"]: o for o in options_raw if o.get("id")}
+        opt = options_by_id.get(chosen_option_id)
         if opt and (opt.get("refer_to") or {}).get("source") == "biographies":
             refer_to_type = (opt["refer_to"].get("type") or "").strip()
     if not refer_to_type:
@@ -3701,66 +4116,72 @@ def general_step_events(type_name, bio_id):
         entry = bio["entries"][idx]
         entry.setdefault("events", [])
 
-        n = len(row_option_ids)
-        for i in range(n):
-            option_id   = (row_option_ids[i] or "").strip()
-            option_disp = (row_option_displays[i] or "").strip()
-            child_id    = (row_child_ids[i] or "").strip() if i < len(row_child_ids) else ""
-            link_type   = (row_link_types[i] or "").strip() if i < len(row_link_types) else ""
-            link_bio    = (row_link_bios[i] or "").strip() if i < len(row_link_bios) else ""
-
-            try:    conf_val = int(row_confidences[i]) if i < len(row_confidences) else 100
-            except: conf_val = 100
-
-            t_kind = (row_time_kinds[i] or "").strip() if i < len(row_time_kinds) else ""
-            try:    t_conf = int(row_time_conf[i]) if i < len(row_time_conf) else 100
-            except: t_conf = 100
+        # one pass over the parallel row lists; rows are driven by row_option_id[]
+        rows = islice(zip_longest(
+            row_option_ids, row_option_displays, row_child_ids, row_link_types, row_link_bios,
+            row_confidences, row_time_kinds, row_time_conf, row_date_values, row_start_dates,
+            row_end_dates, row_time_subvalues, row_time_labels, row_time_label_free,
+            fillvalue="",
+        ), len(row_option_ids))
+        for (option_id, option_disp, child_id, link_type, link_bio, conf_s, t_kind, t_conf_s,
+             date_val, start_d, end_d, subv, tlab, tlab_free) in rows:
+            option_id   = option_id.strip()
+            option_disp = option_disp.strip()
+            child_id    = child_id.strip()
+            link_type   = link_type.strip()
+            link_bio    = link_bio.strip()
+
+            conf_val = _parse_conf(conf_s)
+
+            t_kind = t_kind.strip()
+            t_conf = _parse_conf(t_conf_s)
 
             raw_time = None
             if t_kind:
                 raw_time = {"label_type": t_kind, "confidence": t_conf}
                 if t_kind == "date":
-                    raw_time["date_value"] = (row_date_values[i] or "").strip() if i < len(row_date_values) else ""
+                    raw_time["date_value"] = date_val.strip()
                 elif t_kind == "range":
-                    raw_time["start_date"] = (row_start_dates[i] or "").strip() if i < len(row_start_dates) else ""
-                    raw_time["end_date"]   = (row_end_dates[i] or "").strip() if i < len(row_end_dates) else ""
+                    raw_time["start_date"] = start_d.strip()
+                    raw_time["end_date"]   = end_d.strip()
                 else:
                     if t_kind in time_options_by_key:
-                        raw_time["label_id"]   = (row_time_labels[i] or "").strip() if i < len(row_time_labels) else ""
-                        raw_time["label_free"] = (row_time_label_free[i] or "").strip() if i < len(row_time_label_free) else ""
+                        raw_time["label_id"]   = tlab.strip()
+                        raw_time["label_free"] = tlab_free.strip()
                     else:
-                        raw_time["subvalue"]   = (row_time_subvalues[i] or "").strip() if i < len(row_time_subvalues) else ""
+                        raw_time["subvalue"]   = subv.strip()
+
+            option_display = option_disp or child_id or option_id
+            if not option_display:  # nothing picked or typed on this row
+                continue
 
             normalised = {}
             if raw_time:
                 try:
-                    from time_utils import normalise_time_for_bio_entry
                     normalised = normalise_time_for_bio_entry(raw_time, biography=bio, option_meta=None) or {}
                 except Exception:
                     normalised = {}
 
-            event = {
-                "group_key": group_key,
-                "option_id": option_id or None,
-                "child_option_id": child_id or None,
-                "option_display": (option_disp or child_id or option_id) or None,
-                "link_type": link_type or (refer_to_type or None),
-                "linked_bio": link_bio or None,
-                "confidence": conf_val,
-                "time": raw_time or None,
-                "time_normalised": normalised or None,
-                "created": now_iso_utc(),
-            }
-            event = {k: v for k, v in event.items() if v not in (None, "")}
-            if not event.get("option_id") and not event.get("option_display"):
-                continue
+            # only non-empty fields are stored
+            event = {}
+            if group_key:      event["group_key"] = group_key
+            if option_id:      event["option_id"] = option_id
+            if child_id:       event["child_option_id"] = child_id
+            event["option_display"] = option_display
+            if link_type or refer_to_type:
+                event["link_type"] = link_type or refer_to_type
+            if link_bio:       event["linked_bio"] = link_bio
+            event["confidence"] = conf_val
+            if raw_time:       event["time"] = raw_time
+            if normalised:     event["time_normalised"] = normalised
+            event["created"] = now_iso_utc()
 
             entry["events"].append(event)
             added += 1
 
         if added:
             entry["updated"] = now_iso_utc(); bio["updated"] = entry["updated"]
-            save_dict_as_json(bio_path, bio)
+            save_dict_as_json_later(bio_path, bio)
             flash(f"Added {added} event{'s' if added != 1 else ''}.", "success")
         else:
             flash("No events to add.", "error")
@@ -3793,7 +4214,8 @@ def general_step_events(type_name, bio_id):
         options=options,
         allowed_types=type_list,
         linkable=linkable,
-        target_bios=list_biographies(refer_to_type) if refer_to_type else [],
+        target_bios=(linkable[refer_to_type] if refer_to_type in linkable
+                     else list_biographies(refer_to_type)) if refer_to_type else [],
         time_kinds=time_kinds,
         time_options_by_key=time_options_by_key,
         current_events=current_events,
@@ -3811,7 +4233,7 @@ def general_step_review(type_name, bio_id):
     entry will be created (instead of overwriting the existing one).
     """
     # --- guard / load biography ---
-    bio_path = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
+    bio_path = os.path.join(_type_paths(type_name)[2], f"{bio_id}.json")
     if not os.path.exists(bio_path):
         return f"Biography {bio_id} not found for {type_name}.", 404
 
@@ -3895,9 +4317,38 @@ def restore_archived_type(archived_folder):
         flash(str(e), "error")
     return redirect(url_for("archived_types_list"))
 
+def _date_time_text(t: dict) -> str:
+    return t.get("date_value") or ""
+
+def _range_time_text(t: dict) -> str:
+    s = t.get("start_date") or ""
+    e = t.get("end_date") or ""
+    return f"{s} – {e}".strip() if (s or e) else ""
+
+# label_type -> text for kinds with their own fields; "" falls through to the label/subvalue text
+_TIME_TEXT_BY_KIND = {"date": _date_time_text, "dob": _date_time_text, "range": _range_time_text}
+
+def _event_time_text(t: dict) -> str:
+    """One-line text for an event's saved time block (biography view)."""
+    if not isinstance(t, dict):
+        return ""
+    handler = _TIME_TEXT_BY_KIND.get((t.get("label_type") or "").strip())
+    if handler:
+        text = handler(t)
+        if text:
+            return text
+    label_id = t.get("label_id") or ""
+    label_free = t.get("label_free")
+    if label_free:
+        return f"{label_id} ({label_free})".strip()
+    if label_id:
+        return label_id
+    return (t.get("subvalue") or "").strip()
+
+
 @app.route("/type/<type_name>/bio/<bio_id>")
 def biography_view(type_name, bio_id):
-    bio_path = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
+    bio_path = os.path.join(_type_paths(type_name)[2], f"{bio_id}.json")
     if not os.path.isfile(bio_path):
         return f"Biography '{bio_id}' not found for type '{type_name}'.", 404
 
@@ -3905,32 +4356,23 @@ def biography_view(type_name, bio_id):
     bio.setdefault("entries", [])
 
     # Optional: build a compact, display-ready view of events per entry
-    def _time_text(t: dict) -> str:
-        if not isinstance(t, dict):
-            return ""
-        kind = (t.get("label_type") or "").strip()
-        if kind in ("date", "dob") and t.get("date_value"):
-            return t["date_value"]
-        if kind == "range" and (t.get("start_date") or t.get("end_date")):
-            s = t.get("start_date") or ""
-            e = t.get("end_date") or ""
-            return f"{s} – {e}".strip()
-        if t.get("label_id") or t.get("label_free"):
-            base = t.get("label_id") or ""
-            if t.get("label_free"):
-                base = (base + f" ({t['label_free']})").strip()
-            return base
-        return (t.get("subvalue") or "").strip()
+    # link type -> {bio id: name}, built once per type for the whole view
+    bio_names_by_type: Dict[str, Dict[str, str]] = {}
 
     def _linked_bio_name(link_type: str, linked_bio: str) -> str:
         if not link_type or not linked_bio:
             return ""
-        try:
-            bios = list_biographies(link_type)
-        except Exception:
-            bios = []
-        hit = next((b for b in bios if b.get("id") == linked_bio), None)
-        return (hit or {}).get("name", "") or linked_bio
+        names = bio_names_by_type.get(link_type)
+        if names is None:
+            try:
+                bios = list_biographies(link_type)
+            except Exception:
+                bios = []
+            names = {}
+            for b in bios:
+                names.setdefault(b.get("id"), b.get("name", ""))
+            bio_names_by_type[link_type] = names
+        return names.get(linked_bio) or linked_bio
 
     def _pretty_events(ev_list):
         out = []
@@ -3939,7 +4381,7 @@ def biography_view(type_name, bio_id):
                 if not isinstance(ev, dict):
                     continue
                 title = ev.get("option_display") or ev.get("option_id") or "Event"
-                tt = _time_text(ev.get("time") or {})
+                tt = _event_time_text(ev.get("time") or {})
                 conf = ev.get("confidence")
                 link_type = ev.get("link_type") or ev.get("link_kind")
                 linked_bio = ev.get("linked_bio")
@@ -3967,89 +4409,88 @@ def biography_view(type_name, bio_id):
 
 def _slugify(s: str) -> str:
     s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9/_-]+", "_", s)  # allow _, -, /
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-def _slugify_key(s: str) -> str:
-    s = (s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9/_-]+", "_", s)  # allow _, -, /
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _SLUG_PATH_RE.sub("_", s)
+    s = _UNDERSCORE_RUN_RE.sub("_", s).strip("_")
     return s
 
 
 def _safe_json_write(path: str, data: dict):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json_atomic(path, data)
+
+def _safe_json_create(path: str, data: dict) -> bool:
+    """Write a new JSON file; False (nothing written) if it already exists. O_EXCL, so no check-then-write race."""
+    payload = dumps_json_bytes(data)
+    try:
+        f = open_in_folder(path, "xb")
+    except FileExistsError:
+        return False
+    with f:
+        f.write(payload)
+    bump_cache_generation()
+    return True
 
 # ---------- Properties: list ----------
 @app.route("/type/<type_name>/properties")
 def type_properties(type_name):
-    labels_base = os.path.join("types", type_name, "labels")
+    labels_base = _type_paths(type_name)[1]
     props = []
 
     if os.path.isdir(labels_base):
-        for fname in sorted(os.listdir(labels_base)):
-            fpath = os.path.join(labels_base, fname)
-            if fname.endswith(".json") and os.path.isfile(fpath):
-                key = os.path.splitext(fname)[0]
-                try:
-                    data = load_json_as_dict(fpath) or {}
-                except Exception:
-                    data = {}
-
-                # tolerant reads for name/label/description
-                name = (
-                    data.get("name")
-                    or data.get("label")
-                    or data.get("properties", {}).get("name")
-                    or key.replace("_", " ").title()
-                )
-                desc = (
-                    data.get("description")
-                    or data.get("properties", {}).get("description", "")
-                    or ""
-                )
+        label_entries = [e for e in sorted(cached_scandir(labels_base), key=attrgetter("name"))
+                         if e.name.endswith(".json") and e.is_file(follow_symlinks=False)]
+        # parsed once per file version via the mtime cache (read-only dicts)
+        label_docs = _load_json_many([e.path for e in label_entries])
+        for entry, data in zip(label_entries, label_docs):
+            key = os.path.splitext(entry.name)[0]
+            data = data or {}
+
+            # tolerant reads for name/label/description
+            name = (
+                data.get("name")
+                or data.get("label")
+                or data.get("properties", {}).get("name")
+                or _humanize(key)
+            )
+            desc = (
+                data.get("description")
+                or data.get("properties", {}).get("description", "")
+                or ""
+            )
 
-                # IMPORTANT: surface the archived flag so the template can filter
-                archived_flag = bool(data.get("archived", False))
+            # IMPORTANT: surface the archived flag so the template can filter
+            archived_flag = bool(data.get("archived", False))
 
-                # Provide a minimal "source" so the template can show chips
-                source = {"kind": "labels", "path": f"labels/{key}.json"}
+            # Provide a minimal "source" so the template can show chips
+            source = {"kind": "labels", "path": f"labels/{key}.json"}
 
-                props.append({
-                    "key": key,
-                    "name": name,
-                    "description": desc,
-                    "archived": archived_flag,
-                    "source": source,
-                })
+            props.append({
+                "key": key,
+                "name": name,
+                "description": desc,
+                "archived": archived_flag,
+                "source": source,
+            })
 
     # Optional: also pull non-label property defs, if you keep any there (de-dup by key)
     props_base = os.path.join("types", type_name, "properties")
     if os.path.isdir(props_base):
         seen = {p["key"] for p in props}
-        for fname in sorted(os.listdir(props_base)):
-            fpath = os.path.join(props_base, fname)
-            if fname.endswith(".json") and os.path.isfile(fpath):
-                key = os.path.splitext(fname)[0]
-                if key in seen:
-                    continue
-                try:
-                    data = load_json_as_dict(fpath) or {}
-                except Exception:
-                    data = {}
-                name = data.get("name") or data.get("label") or key.replace("_", " ").title()
-                desc = data.get("description", "")
-                props.append({
-                    "key": key,
-                    "name": name,
-                    "description": desc,
-                    "archived": bool(data.get("archived", False)),
-                    "source": {"kind": data.get("source", {}).get("kind", "property"),
-                               "path": f"properties/{key}.json"},
-                })
+        prop_entries = [e for e in sorted(cached_scandir(props_base), key=attrgetter("name"))
+                        if e.name.endswith(".json") and e.is_file(follow_symlinks=False)
+                        and os.path.splitext(e.name)[0] not in seen]
+        for entry, data in zip(prop_entries, _load_json_many([e.path for e in prop_entries])):
+            key = os.path.splitext(entry.name)[0]
+            data = data or {}
+            name = data.get("name") or data.get("label") or _humanize(key)
+            desc = data.get("description", "")
+            props.append({
+                "key": key,
+                "name": name,
+                "description": desc,
+                "archived": bool(data.get("archived", False)),
+                "source": {"kind": data.get("source", {}).get("kind", "property"),
+                           "path": f"properties/{key}.json"},
+            })
 
     # Show label subfolders for context
     subfolders = []
@@ -4141,7 +4582,7 @@ def new_property(type_name):
             return redirect(request.url)
 
         payload = {
-            "name": name or key.replace("_", " ").title(),
+            "name": name or _humanize(key),
             "description": (request.form.get("description") or "").strip(),
         }
 
@@ -4219,7 +4660,7 @@ def edit_property(type_name, prop_key):
     prop = load_json_as_dict(path)
 
     if request.method == "POST":
-        name        = (request.form.get("name") or "").strip() or prop.get("name") or prop_key.replace("_", " ").title()
+        name        = (request.form.get("name") or "").strip() or prop.get("name") or _humanize(prop_key)
         raw_new_key = (request.form.get("key") or prop_key).strip().lower()
         new_key     = _slugify_key(raw_new_key or name) or prop_key
 
@@ -4285,9 +4726,11 @@ def edit_property(type_name, prop_key):
         # Save (handle rename)
         new_path = os.path.join(base, f"{new_key}.json")
         save_dict_as_json(new_path, payload)
-        if new_path != path and os.path.exists(path):
+        if new_path != path:
             try:
-                os.remove(path)
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
             except Exception as e:
                 print(f"[WARN] Failed to remove old property file {path}: {e}")
 
@@ -4363,9 +4806,9 @@ def _bio_path(type_name: str, bio_id: str) -> str:
 
 def set_bio_archived(type_name: str, bio_id: str, archived: bool) -> bool:
     p = _bio_path(type_name, bio_id)
-    if not os.path.exists(p):
+    data = _try_load_bio(p)
+    if data is None:
         return False
-    data = load_json_as_dict(p) or {}
     data["archived"] = bool(archived)
     if archived:
         data["archived_at"] = now_iso_utc()
@@ -4470,7 +4913,7 @@ def api_create_label_values():
             continue  # skip existing; add overwrite flag later if you want
         doc = {
             "id": oid,
-            "display": it.get("display") or oid.replace("_", " ").title(),
+            "display": it.get("display") or _humanize(oid),
         }
         if it.get("description"): doc["description"] = it["description"]
         if it.get("image"):       doc["image"]       = it["image"]
@@ -4497,6 +4940,40 @@ def diag_llm():
     except Exception as e:
         return {"ok": False, "error": f"{type(e).__name__}: {e}"}, 500
 
+# bio path -> (parsed doc the vectors were built from, vectors by time).
+# load_json_cached hands back the same dict until the file's (mtime_ns, size)
+# changes, so an identity check on the doc is the staleness test.
+_BIO_VECTORS_CACHE = {}
+_BIO_VECTORS_MAX = 2048
+
+# entry keys that are never label lists
+_RESERVED_ENTRY_KEYS = frozenset({"time", "time_normalised", "events", "created", "updated", "status"})
+
+@lru_cache(maxsize=1 << 16)
+def _norm(s: str) -> str:
+    """Looser match: lower-case + strip. None-safe; memoised, as most_like repeats the same strings."""
+    return (s or "").strip().lower()
+
+
+def _label_vkey(label_type: str, label_id: str) -> str:
+    """Normalised vector key for a label."""
+    return f"L::{_norm(label_type)}::{_norm(label_id)}"
+
+
+def _event_vkey(ev: dict) -> str:
+    """
+    Normalised vector key for an event.
+    Uses: group_key / option_id / child_option_id / link_type / linked_bio
+    (drop empties at the end).
+    """
+    gk   = _norm(ev.get("group_key") or "event")
+    oid  = _norm(ev.get("option_id") or ev.get("option_display"))
+    cid  = _norm(ev.get("child_option_id"))
+    ltyp = _norm(ev.get("link_type"))
+    lbio = _norm(ev.get("linked_bio"))
+    parts = [p for p in (gk, oid, cid, ltyp, lbio) if p]
+    return "E::" + "/".join(parts) if parts else "E::" + gk
+
 @app.route("/most_like/<type_name>/<bio_id>")
 def most_like_type(type_name, bio_id):
     """
@@ -4513,10 +4990,6 @@ def most_like_type(type_name, bio_id):
 
     # -------------------- helpers --------------------
 
-    def _norm(s: str) -> str:
-        """Looser match: lower-case + strip. None-safe."""
-        return (s or "").strip().lower()
-
     def _safe_name(x: dict, fallback: str) -> str:
         return (x or {}).get("name") or fallback
 
@@ -4541,24 +5014,6 @@ def most_like_type(type_name, bio_id):
             return f"{s}..{e}".strip(".")
         return "unknown"
 
-    def _label_vkey(label_type: str, label_id: str) -> str:
-        """Normalised vector key for a label."""
-        return f"L::{_norm(label_type)}::{_norm(label_id)}"
-
-    def _event_vkey(ev: dict) -> str:
-        """
-        Normalised vector key for an event.
-        Uses: group_key / option_id / child_option_id / link_type / linked_bio
-        (drop empties at the end).
-        """
-        gk   = _norm(ev.get("group_key") or "event")
-        oid  = _norm(ev.get("option_id") or ev.get("option_display"))
-        cid  = _norm(ev.get("child_option_id"))
-        ltyp = _norm(ev.get("link_type"))
-        lbio = _norm(ev.get("linked_bio"))
-        parts = [p for p in (gk, oid, cid, ltyp, lbio) if p]
-        return "E::" + "/".join(parts) if parts else "E::" + gk
-
     def _extract_vectors_by_time(bio_json: dict) -> dict:
         """
         Return:
@@ -4572,7 +5027,7 @@ def most_like_type(type_name, bio_id):
 
             # Labels: any list under entry except reserved keys
             for bucket_key, values in (entry or {}).items():
-                if bucket_key in ("time", "time_normalised", "events", "created", "updated", "status"):
+                if bucket_key in _RESERVED_ENTRY_KEYS:
                     continue
                 if not isinstance(values, list):
                     continue
@@ -4587,7 +5042,7 @@ def most_like_type(type_name, bio_id):
                     slot[vkey] = {
                         "confidence": int(lab.get("confidence", 100)),
                         "kind": "label",
-                        "display": lab.get("display") or lid.replace("_", " ").title(),
+                        "display": lab.get("display") or _humanize(lid),
                         "meta": {"label_type": ltyp, "id": lid}
                     }
 
@@ -4624,35 +5079,51 @@ def most_like_type(type_name, bio_id):
                 }
         return out
 
+    def _vectors_for(path: str, doc: dict) -> dict:
+        """_extract_vectors_by_time, reused while the bio file is unchanged (read-only)."""
+        hit = _BIO_VECTORS_CACHE.get(path)
+        if hit and hit[0] is doc:
+            return hit[1]
+        vecs = _extract_vectors_by_time(doc)
+        if len(_BIO_VECTORS_CACHE) >= _BIO_VECTORS_MAX:
+            _BIO_VECTORS_CACHE.pop(next(iter(_BIO_VECTORS_CACHE)), None)
+        _BIO_VECTORS_CACHE[path] = (doc, vecs)
+        return vecs
+
     # -------------------- load target --------------------
     target_path = os.path.join("types", type_name, "biographies", f"{bio_id}.json")
     if not os.path.exists(target_path):
         return f"{type_name} biography '{bio_id}' not found.", 404
 
-    target = load_json_as_dict(target_path) or {}
+    target = load_json_cached(target_path) or {}
     target_name = _safe_name(target, bio_id)
-    target_vecs = _extract_vectors_by_time(target)
+    target_vecs = _vectors_for(target_path, target)
+
+    # target side never changes inside the candidate loop
+    target_keys_by_time = {tk: frozenset(v) for tk, v in target_vecs.items()}
 
     # -------------------- compare with others --------------------
     bio_folder = os.path.join("types", type_name, "biographies")
     candidates = []
 
-    for fn in sorted(os.listdir(bio_folder)):
-        if not fn.endswith(".json"):
-            continue
-        other_id = fn[:-5]
-        if other_id == bio_id:
-            continue
+    # listing order is fine here: ties on mse are broken by id when ranking below
+    other_entries = [e for e in cached_scandir(bio_folder)
+                     if e.name.endswith(".json") and e.name[:-5] != bio_id
+                     and e.is_file(follow_symlinks=False)]
+    others = [e.name[:-5] for e in other_entries]
+    # parsed via the mtime cache (orjson when installed), read concurrently
+    other_docs = _load_json_many([e.path for e in other_entries])
 
-        other = load_json_as_dict(os.path.join(bio_folder, fn)) or {}
-        other_vecs = _extract_vectors_by_time(other)
+    for entry, other_id, other in zip(other_entries, others, other_docs):
+        other = other or {}
+        other_vecs = _vectors_for(entry.path, other)
 
         # Compare only on overlapping time buckets
-        shared_times = set(target_vecs.keys()) & set(other_vecs.keys())
+        shared_times = target_keys_by_time.keys() & other_vecs.keys()
         if not shared_times:
             continue
 
-        total_err = 0.0
+        total_sq = 0  # sum of squared 0..100 confidence gaps (ints, scaled once below)
         count = 0
 
         shared_labels_by_time = {}
@@ -4662,7 +5133,7 @@ def most_like_type(type_name, bio_id):
         for tk in shared_times:
             tv = target_vecs[tk]
             ov = other_vecs[tk]
-            all_keys = set(tv.keys()) | set(ov.keys())
+            all_keys = target_keys_by_time[tk].union(ov)
 
             for k in all_keys:
                 t_item = tv.get(k)
@@ -4670,9 +5141,9 @@ def most_like_type(type_name, bio_id):
                 t_conf = (t_item or {}).get("confidence", 0)
                 o_conf = (o_item or {}).get("confidence", 0)
 
-                # pure 0..100 difference → normalised to 0..1 for MSE term
-                err = ((t_conf - o_conf) / 100.0) ** 2
-                total_err += err
+                # pure 0..100 difference; normalised to 0..1 once for the MSE
+                gap = t_conf - o_conf
+                total_sq += gap * gap
                 count += 1
 
                 if t_item and o_item:
@@ -4698,7 +5169,7 @@ def most_like_type(type_name, bio_id):
         if count == 0:
             continue
 
-        mse = total_err / count
+        mse = total_sq / (count * 10000.0)
 
         candidates.append({
             "id": other_id,
@@ -4712,7 +5183,7 @@ def most_like_type(type_name, bio_id):
             "comparison_count": count,                   # NEW: pill in UI
         })
 
-    candidates.sort(key=lambda x: x["mse"])
+    candidates.sort(key=itemgetter("mse", "id"))
     top_matches = candidates[:5]
 
     return render_template(
@@ -4731,12 +5202,7 @@ def add_label(type_name, subfolder_name):
     os.makedirs(labels_dir, exist_ok=True)
 
     def _slug(s: str) -> str:
-        try:
-            from utils import _slugify_key  # if you already have it
-            return _slugify_key(s)
-        except Exception:
-            import re
-            return re.sub(r'[^a-z0-9_]+', '_', (s or '').lower()).strip('_')
+        return _SLUG_RE.sub('_', (s or '').lower()).strip('_')
 
     if request.method == 'POST':
         # round-trip target
@@ -4778,7 +5244,8 @@ def add_label(type_name, subfolder_name):
 
         # guard duplicate (case-insensitive)
         label_filename = f"{label_id}.json"
-        existing = {f.lower() for f in os.listdir(labels_dir) if f.endswith('.json')}
+        with os.scandir(labels_dir) as it:
+            existing = {e.name.lower() for e in it if e.name.endswith('.json')}
         if label_filename.lower() in existing:
             flash("❌ A label with this key already exists in this folder.", "error")
             return redirect(request.url)
@@ -4802,8 +5269,7 @@ def add_label(type_name, subfolder_name):
         label_data = {k: v for k, v in label_data.items() if v not in (None, "", {}) or k == "properties"}
 
         # save label
-        with open(label_path, 'w') as f:
-            json.dump(label_data, f, indent=2)
+        _safe_json_write(label_path, label_data)
 
         # optionally create nested folders
         if make_children:
@@ -4823,8 +5289,7 @@ def add_label(type_name, subfolder_name):
                         "source": "auto-generated from label",
                         "entries": []
                     }
-                    with open(stub_path, 'w') as f:
-                        json.dump(stub_data, f, indent=2)
+                    _safe_json_write(stub_path, stub_data)
 
         flash(f"✅ Label “{display_name}” added.", "success")
         if make_children:
@@ -5201,7 +5666,8 @@ def create_subfolder(type_name):
 
 
 def _slugify_key(s: str) -> str:
-    return "".join([c if c.isalnum() or c == "_" else "_" for c in (s or "").strip().lower()]).strip("_")
+    # \W is exactly "not isalnum() and not _", so each such character becomes "_" as before
+    return _NON_WORD_CHAR_RE.sub("_", (s or "").strip().lower()).strip("_")
 
 
 def _group_paths(base: str, group_key: str):
@@ -5249,6 +5715,8 @@ def _clear_label_options_folder(folder: str) -> int:
                 removed += 1
             except Exception as e:
                 print("[WARN] failed removing", fn, ":", e)
+    if removed:
+        bump_cache_generation()
     return removed
 
 @app.route("/type/<type_name>/labels/group/<path:group_key>/edit", methods=["GET", "POST"])
@@ -5268,7 +5736,7 @@ def edit_label_group(type_name, group_key):
 
     data = load_json_as_dict(json_path) or {}
     # defaults
-    data.setdefault("label",        leaf.replace("_", " ").title())
+    data.setdefault("label",        _humanize(leaf))
     data.setdefault("description",  "")
     data.setdefault("order",        999)
 
@@ -5394,6 +5862,7 @@ def edit_label_group(type_name, group_key):
             os.makedirs(os.path.dirname(new_folder_dir), exist_ok=True)
             try:
                 os.replace(folder_dir, new_folder_dir)
+                forget_ensured_dirs()
             except Exception as e:
                 flash(f"Failed to rename group folder: {e}", "error")
                 return redirect(request.url)
@@ -5744,7 +6213,7 @@ def person_view(person_id):
                     if isinstance(v, dict):
                         label = v.get("display") or v.get("label") or v.get("id")
                         if label:
-                            summary.append(label.replace("_", " ").title())
+                            summary.append(_humanize(label))
         return ", ".join(summary)
 
     def format_uk_date(datestr):
@@ -5856,8 +6325,11 @@ def cancel_person_creation():
 
     if person_id:
         file_path = f"./types/person/biographies/{person_id}.json"
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        try:
+            os.unlink(file_path)
+            bump_cache_generation()
+        except FileNotFoundError:
+            pass
 
     return redirect('/')
 
@@ -6798,15 +7270,8 @@ def biography_editentry_page(type_name, biography_name, entry_index):
     if not os.path.exists(biography_path):
         return f"<h1>Error: Biography Not Found</h1>", 404
 
-    # Helper to load JSON
-    def load_json_as_dict(path):
-        try:
-            with open(path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
-
-    bio_data = load_json_as_dict(biography_path)
+    # via utils, so a save still queued by save_dict_as_json_later is seen
+    bio_data = load_json_as_dict(biography_path) or {}
     entries_list = bio_data.get("entries", [])
     if entry_index >= len(entries_list):
         return "<h1>Error: Entry Index Out of Range</h1>", 404
@@ -7495,9 +7960,9 @@ def view_labels(type_name):
                     # Construct image URL if it exists
                     image_url = f"/types/{type_name}/labels/{entry}/{image_filename}" if os.path.exists(image_full_path) else None
                     
-                    with open(json_path, 'r') as jf:
+                    with open(json_path, 'rb') as jf:
                         try:
-                            data = json.load(jf)
+                            data = json_loads(jf.read())
                             description = data.get("description", "")
                             properties = data.get("properties", {})
 
@@ -8103,6 +8568,7 @@ def biography_restore(type_name, biography_name):
         # Restore subfolder if it exists
         if os.path.exists(archived_folder):
             shutil.move(archived_folder, biography_folder)
+            forget_ensured_dirs()
 
         return jsonify({"message": "Biography restored successfully"}), 200
     except Exception as e:
@@ -8207,6 +8673,7 @@ def biography_edit(type_name, biography_name):
             os.rename(biography_path, new_biography_path)  # Rename JSON file
             if os.path.exists(biography_folder_path):
                 os.rename(biography_folder_path, new_folder_path)  # Rename folder
+                forget_ensured_dirs()
 
         # Save updated JSON
         save_dict_as_json(new_biography_path, bio_data)
@@ -8605,7 +9072,7 @@ def events_add():
     # Time catalog for events (you can put decade/era etc. under types/events/labels/_time/*)
     def _time_catalog_for_events():
         try:
-            return load_time_catalog("events")
+            return _load_time_catalog_cached("events")
         except Exception:
             return {"categories":[{"key":"date","description":"A date in time"},
                                   {"key":"life_stage","description":"A period"}],
@@ -8670,7 +9137,6 @@ def events_add():
                 break
 
         try:
-            from time_utils import normalise_time_for_bio_entry
             time_norm = normalise_time_for_bio_entry(raw_time, biography={}, option_meta=opt_meta)
         except Exception:
             time_norm = {}
@@ -8690,7 +9156,7 @@ def events_add():
         payload = {
             "id": new_id,
             "uid": uuid.uuid4().hex,
-            "name": name or new_id.replace("_"," ").title(),
+            "name": name or _humanize(new_id),
             "type": "events",
             "created": now_iso,
             "updated": now_iso,
@@ -42,4 +42,14 @@ def test_most_like_endpoint(client):
     rv = client.get(f"/most_like/person/{bio_id}")
     assert rv.status_code == 200
     txt = rv.data.lower()
-    assert b"most" in txt or b"similar" in txt
\ No newline at end of file
+    assert b"most" in txt or b"similar" in txt
+
+def test_time_step_pages_render(client):
+    bio_id = "joseph_lister"
+    rv = client.get(f"/person_step/time/{bio_id}")
+    assert rv.status_code == 200
+    assert b"Joseph Lister" in rv.data or bio_id.encode() in rv.data
+
+    rv = client.get(f"/general_step/time/person/{bio_id}")
+    assert rv.status_code == 200
+    assert b"Joseph Lister" in rv.data or bio_id.encode() in rv.data
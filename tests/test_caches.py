@@ -0,0 +1,183 @@
+# tests/test_caches.py
+# Route-level checks that the in-process caches pick up writes, and that the
+# cached render paths still render.
+import json
+import os
+import shutil
+
+import pytest
+
+import general
+import utils
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BIO = "joseph_lister"
+
+
+@pytest.fixture()
+def client():
+    # no live LLM calls during tests
+    os.environ.pop("OPENAI_API_KEY", None)
+    general.app.config.update(TESTING=True)
+    return general.app.test_client()
+
+
+@pytest.fixture()
+def sandbox(client, tmp_path, monkeypatch):
+    """Run against a throwaway copy of types/ so the writes below never touch the repo."""
+    shutil.copytree(os.path.join(ROOT, "types"), tmp_path / "types")
+    monkeypatch.chdir(tmp_path)
+    utils.bump_cache_generation()
+    utils.forget_ensured_dirs()
+    yield client
+    utils.flush_json_saves()  # queued writes use relative paths: land them before leaving tmp_path
+    utils.bump_cache_generation()
+
+
+def _bio_path(bio_id, type_name="person"):
+    return os.path.join("types", type_name, "biographies", f"{bio_id}.json")
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ---------- render paths ----------
+
+@pytest.mark.parametrize("url", [
+    "/type/person/labels",
+    "/general_iframe_wizard?step=start",
+    f"/general_iframe_wizard?type=person&bio_id={BIO}&step=time",
+    f"/person_step/time/{BIO}",
+    f"/general_step/time/person/{BIO}",
+    f"/general_step/labels/person/{BIO}",
+    f"/general_step/events/person/{BIO}",
+    f"/general_step/review/person/{BIO}",
+    f"/type/person/bio/{BIO}",
+    "/type/person/properties",
+    "/type/person/properties/new",
+    f"/most_like/person/{BIO}",
+])
+def test_cached_render_paths(sandbox, url):
+    # some steps start a new entry on GET, hence the sandbox
+    assert sandbox.get(url).status_code == 200
+
+
+# ---------- cache invalidation after writes ----------
+
+def test_bios_list_sees_new_and_renamed_bios(sandbox):
+    names = lambda: {i["name"] for i in sandbox.get("/api/bios/list?type=person").get_json()["items"]}
+    assert "Zebulon Quill" not in names()
+
+    utils.save_dict_as_json(_bio_path("zebulon_quill"), {"name": "Zebulon Quill", "entries": []})
+    assert "Zebulon Quill" in names()
+
+    utils.save_dict_as_json(_bio_path("zebulon_quill"), {"name": "Zebulon Quill II", "entries": []})
+    assert "Zebulon Quill II" in names()
+    assert "Zebulon Quill" not in names()
+
+
+def test_list_biographies_drops_archived_bio(sandbox):
+    assert BIO in {b["id"] for b in general.list_biographies("person")}
+    rv = sandbox.post(f"/api/bio/person/{BIO}/archive", data={"next": "/"})
+    assert rv.status_code == 302
+    assert BIO not in {b["id"] for b in general.list_biographies("person")}
+    assert all("_sort_updated" not in b for b in general.list_biographies("person", include_archived=True))
+
+
+def test_global_search_sees_new_bio(sandbox, monkeypatch):
+    seen = {}
+    monkeypatch.setattr(general, "render_template", lambda name, **ctx: seen.update(ctx) or "")
+    search = lambda q: (sandbox.get("/global_search", query_string={"q": q}), seen["results"])[1]
+
+    assert search("quill") == []
+    utils.save_dict_as_json(_bio_path("zebulon_quill"), {
+        "name": "Seán Quill",
+        "time": [{"date_value": "1990-11-05"}],
+    })
+    assert search("quill") == [("zebulon_quill", "Seán Quill")]
+    # accented letters are searchable; the whole query must still appear as typed
+    assert search("seán") == [("zebulon_quill", "Seán Quill")]
+    assert search("1990-11") == [("zebulon_quill", "Seán Quill")]
+    assert search("1990-05") == []
+
+
+def test_label_groups_see_added_label(sandbox):
+    page = lambda: sandbox.get(f"/general_step/labels/person/{BIO}").data
+    assert b"Violet Haze" not in page()
+
+    rv = sandbox.post("/add_label/person/eye_colour",
+                      data={"label_name": "Violet Haze", "return_url": "/"})
+    assert rv.status_code == 302
+    assert b"Violet Haze" in page()
+
+
+def test_time_catalog_sees_new_category(sandbox):
+    page = lambda: sandbox.get(f"/general_step/time/person/{BIO}").data
+    assert b"Zz Epoch" not in page()
+
+    utils.save_dict_as_json(os.path.join("types", "time", "labels", "zz_epoch.json"),
+                            {"description": "test category"})
+    assert b"Zz Epoch" in page()
+
+
+def test_property_form_sees_new_group(sandbox):
+    page = lambda: sandbox.get("/type/person/properties/new").data
+    assert b"zz_new_group" not in page()
+
+    utils.save_dict_as_json(os.path.join("types", "person", "labels", "zz_new_group", "_group.json"),
+                            {"label": "New group"})
+    assert b"zz_new_group" in page()
+
+
+def test_properties_list_sees_renamed_property(sandbox):
+    path = os.path.join("types", "person", "labels", "nickname.json")
+    page = lambda: sandbox.get("/type/person/properties").data
+    assert b"Alias Of Record" not in page()
+
+    prop = _read(path)
+    prop["name"] = "Alias Of Record"
+    utils.save_dict_as_json(path, prop)
+    assert b"Alias Of Record" in page()
+
+
+def test_most_like_sees_edited_candidate(sandbox):
+    target = _read(_bio_path(BIO))
+    page = lambda: sandbox.get(f"/most_like/person/{BIO}").data.decode()
+    assert "MSE 0.0000" not in page()
+
+    # a candidate with exactly the target's entries is a perfect match
+    utils.save_dict_as_json(_bio_path("zz_twin"), {"name": "Zz Twin", "entries": target["entries"]})
+    html = page()
+    assert "Zz Twin" in html
+    assert html.index("Zz Twin") < html.index("MSE 0.0000")
+
+
+def test_queued_event_save_is_read_back(sandbox):
+    with sandbox.session_transaction() as s:
+        s["entry_index"] = 0
+    rv = sandbox.post(f"/general_step/events/person/{BIO}", data={
+        "do_save": "1", "group_key": "milestone",
+        "row_option_id[]": ["graduation"], "row_option_display[]": ["Graduation"],
+        "next_action": "stay",
+    })
+    assert rv.status_code == 302
+
+    # queued or already written, the app reads the new data straight away
+    events = lambda doc: doc["entries"][0].get("events", [])
+    assert any(e.get("option_id") == "graduation" for e in events(utils.load_json_as_dict(_bio_path(BIO))))
+    assert b"Graduation" in sandbox.get(f"/type/person/bio/{BIO}").data
+
+    utils.flush_json_saves()
+    assert any(e.get("option_id") == "graduation" for e in events(_read(_bio_path(BIO))))
+
+
+def test_write_recreates_removed_folder(sandbox):
+    path = os.path.join("types", "person", "labels", "zz_gone", "opt.json")
+    utils.save_dict_as_json(path, {"id": "opt"})
+    shutil.rmtree(os.path.dirname(path))  # behind the app's back
+
+    assert utils.save_dict_as_json(path, {"id": "opt", "v": 2})
+    assert _read(path)["v"] == 2
+    assert general._safe_json_create(os.path.join("types", "person", "zz_gone2", "x.json"), {"id": "x"})
@@ -1,23 +1,99 @@
-import re, math, os, json, uuid, re, shutil, sqlite3, urllib.request, urllib.error, urllib.parse
+import re, math, os, json, uuid, re, shutil, sqlite3, stat, threading, time, urllib.request, urllib.error, urllib.parse
+import atexit
 from datetime import datetime, timezone
 from difflib import SequenceMatcher
 from openai import OpenAI
 import glob
 from typing import List, Dict, Any, Optional
 
+try:
+    import orjson  # optional: much faster parsing of the many small label/bio files
+except ImportError:
+    orjson = None
+
 
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 
 IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".webp", ".gif")
 
-def _sibling_image(folder: str, lid: str) -> str:
-    """Return '/types/.../<lid>.<ext>' if a sibling image exists, else ''."""
-    for ext in IMAGE_EXTS:
-        cand = os.path.join(folder, lid + ext)
-        if os.path.exists(cand):
-            rel = os.path.relpath(cand, ".").replace("\\", "/")
-            return rel if rel.startswith("/") else f"/{rel}"
+def image_index(folder: str, exts=IMAGE_EXTS) -> dict:
+    """
+    {stem: filename} for the image files in folder, from a single directory read.
+    When a stem has several images, the extension listed first in `exts` wins.
+    """
+    rank = {e: i for i, e in enumerate(exts)}
+    best = {}
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                n = e.name
+                i = n.rfind(".")
+                r = rank.get(n[i:]) if i > 0 else None
+                if r is None or not e.is_file():
+                    continue
+                stem = n[:i]
+                if stem not in best or r < best[stem][0]:
+                    best[stem] = (r, n)
+    except OSError:
+        return {}
+    return {stem: n for stem, (_, n) in best.items()}
+
+# Few ids: stat each candidate relative to an open dir fd (fstatat) instead of reading the
+# whole directory. Above this many ids a single scandir is cheaper.
+_IMAGE_PROBE_MAX = 8
+_HAS_DIR_FD = hasattr(os, "O_DIRECTORY") and os.stat in os.supports_dir_fd
+
+def _probe_images(folder: str, ids, exts=IMAGE_EXTS) -> dict:
+    """{stem: filename} for the given ids only, same precedence as image_index."""
+    try:
+        dfd = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return {}
+    found = {}
+    try:
+        for lid in ids:
+            for ext in exts:
+                try:
+                    st = os.stat(lid + ext, dir_fd=dfd)
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode):
+                    found[lid] = lid + ext
+                    break
+    finally:
+        os.close(dfd)
+    return found
+
+def image_urls(folder: str, exts=IMAGE_EXTS, ids=None) -> dict:
+    """
+    {stem: '/types/.../<stem>.<ext>'} for the images in folder (see image_index).
+    The folder's URL prefix is resolved once rather than per option. Passing the
+    option `ids` lets small folders be probed per id rather than listed.
+    """
+    if ids is not None and _HAS_DIR_FD and len(ids) <= _IMAGE_PROBE_MAX:
+        images = _probe_images(folder, ids, exts)
+    else:
+        images = image_index(folder, exts)
+    if not images:
+        return {}
+    rel = os.path.relpath(folder, ".").replace("\\", "/")
+    prefix = (rel if rel.startswith("/") else f"/{rel}") + "/"
+    return {stem: prefix + n for stem, n in images.items()}
+
+def _sibling_image(folder: str, lid: str, images=None) -> str:
+    """
+    Return '/types/.../<lid>.<ext>' if a sibling image exists, else ''.
+    Pass `images` (from image_index) when looking up many ids in the same folder.
+    """
+    if images is not None:
+        name = images.get(lid)
+        cands = [os.path.join(folder, name)] if name else []
+    else:
+        cands = [c for c in (os.path.join(folder, lid + ext) for ext in IMAGE_EXTS) if os.path.exists(c)][:1]
+    for cand in cands:
+        rel = os.path.relpath(cand, ".").replace("\\", "/")
+        return rel if rel.startswith("/") else f"/{rel}"
     return ""
 
 def load_json_safe(path):
@@ -112,34 +188,348 @@ def _map_existing_bio_selections(groups, saved_items):
 
 # ---------------------- JSON utilities ----------------------
 
+def json_loads(buf):
+    """Parse JSON text/bytes with orjson when installed, else the stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals, which the stdlib accepts
+    return json.loads(buf)
+
+
 def save_dict_as_json(file_path, dictionary):
     try:
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(dictionary, f, ensure_ascii=False, indent=4)
+        # encoded in one go and swapped in atomically; the 4-space layout is kept
+        write_json_atomic(file_path, dictionary, indent=4)
         return True
     except IOError as e:
         print(f"Error saving JSON file {file_path}: {e}")
         return False
 
 
+def dumps_json_bytes(data, indent=2, sort_keys=False):
+    """
+    Serialise to UTF-8 JSON bytes (orjson when installed and indent is 2 or None, else the stdlib).
+    indent=None gives compact output.
+    """
+    if orjson is not None and indent in (2, None):
+        opt = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            opt |= orjson.OPT_INDENT_2
+        if sort_keys:
+            opt |= orjson.OPT_SORT_KEYS
+        try:
+            return orjson.dumps(data, option=opt)
+        except TypeError:
+            pass  # e.g. ints wider than 64 bits, which the stdlib handles
+    separators = (",", ":") if indent is None else None
+    return json.dumps(data, ensure_ascii=False, indent=indent, sort_keys=sort_keys,
+                      separators=separators).encode("utf-8")
+
+
+# folders this process has already created/seen, so repeat writes skip the
+# makedirs syscalls; anything that moves or removes folders calls forget_ensured_dirs(),
+# and open_in_folder re-makes a folder that vanished some other way
+_ENSURED_DIRS = set()
+
+
+def ensure_dir(path):
+    """os.makedirs(path, exist_ok=True), done once per folder per process."""
+    if path not in _ENSURED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+
+def forget_ensured_dirs():
+    """Drop the ensure_dir memo (after renaming, moving or archiving folders)."""
+    _ENSURED_DIRS.clear()
+
+
+def open_in_folder(file_path, mode):
+    """
+    open() after ensure_dir() on the file's folder. If the folder was removed since it
+    was remembered (hand edit, another worker...), it is made again and the open retried once.
+    """
+    folder = os.path.dirname(file_path) or "."
+    ensure_dir(folder)
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        _ENSURED_DIRS.discard(folder)
+        ensure_dir(folder)
+        return open(file_path, mode)
+
+
+def _replace_file_bytes(file_path, payload):
+    """Write payload to a temp file beside file_path and os.replace() it into place."""
+    tmp = f"{file_path}.tmp{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open_in_folder(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, file_path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+# ---------------------- write-behind saves ----------------------
+
+# normpath -> encoded JSON still waiting for the writer thread
+_PENDING_WRITES = {}
+_PENDING_COND = threading.Condition()
+# held around every file replace, so a queued (older) payload never lands after a direct write
+_FILE_WRITE_LOCK = threading.Lock()
+_WRITER_THREAD = None
+
+
+def _write_pending(path, payload):
+    """Write one queued payload unless a newer save has superseded it; then drop it from the queue."""
+    with _FILE_WRITE_LOCK:
+        if _PENDING_WRITES.get(path) is not payload:
+            return
+        try:
+            _replace_file_bytes(path, payload)
+        except OSError as e:
+            print(f"Error saving JSON file {path}: {e}")
+        with _PENDING_COND:
+            if _PENDING_WRITES.get(path) is payload:
+                del _PENDING_WRITES[path]
+    bump_cache_generation()
+
+
+def _json_writer():
+    while True:
+        with _PENDING_COND:
+            while not _PENDING_WRITES:
+                _PENDING_COND.wait()
+            path, payload = next(iter(_PENDING_WRITES.items()))
+        _write_pending(path, payload)
+
+
+def save_dict_as_json_later(file_path, dictionary):
+    """
+    save_dict_as_json without waiting on the disk: the dict is encoded now and a
+    background thread writes it (temp file + os.replace). Repeated saves of one path
+    collapse into the newest. Until it lands, load_json_as_dict / load_json_cached
+    read the queued copy, so a redirect straight after the save sees the new data.
+
+    The queue lives in this process only: anything that reads the file some other
+    way (a direct open(), another worker process) can see the old contents, so
+    read through load_json_as_dict, and run a single worker process when this is
+    used (or call flush_json_saves() before handing the file to anything else).
+    """
+    global _WRITER_THREAD
+    payload = dumps_json_bytes(dictionary, indent=4)
+    with _PENDING_COND:
+        _PENDING_WRITES[os.path.normpath(file_path)] = payload
+        if _WRITER_THREAD is None:
+            _WRITER_THREAD = threading.Thread(target=_json_writer, name="json-writer", daemon=True)
+            _WRITER_THREAD.start()
+        _PENDING_COND.notify()
+    bump_cache_generation()
+    return True
+
+
+@atexit.register
+def flush_json_saves():
+    """Write everything still queued by save_dict_as_json_later (also runs at interpreter exit)."""
+    while _PENDING_WRITES:
+        with _PENDING_COND:
+            if not _PENDING_WRITES:
+                break
+            path, payload = next(iter(_PENDING_WRITES.items()))
+        _write_pending(path, payload)
+
+
+def _pending_json(file_path):
+    """Parsed copy of a save still queued for file_path, else None."""
+    if not _PENDING_WRITES:
+        return None
+    payload = _PENDING_WRITES.get(os.path.normpath(file_path))
+    return None if payload is None else json_loads(payload)
+
+
+def write_json_atomic(file_path, data, indent=2):
+    """
+    Write JSON via a temp file in the same folder and os.replace() it into place,
+    so readers never see a half-written file. Raises on failure.
+    """
+    payload = dumps_json_bytes(data, indent)
+    with _FILE_WRITE_LOCK:
+        if _PENDING_WRITES:
+            with _PENDING_COND:  # this write is newer than anything queued for the path
+                _PENDING_WRITES.pop(os.path.normpath(file_path), None)
+        _replace_file_bytes(file_path, payload)
+    bump_cache_generation()
+
+
 def load_json_as_dict(file_path):
     """
     Load the JSON file at file_path into a dictionary.
     Returns an empty dict if the file does not exist or cannot be read.
     """
+    pending = _pending_json(file_path)
+    if pending is not None:
+        return pending
     if not os.path.exists(file_path):
         return {}
     try:
-        with open(file_path, "r", encoding="utf-8") as json_file:
-            return json.load(json_file)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(file_path, "rb") as json_file:
+            return json_loads(json_file.read())
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
         print(f"Error loading JSON file {file_path}: {e}")
         return {}
 
 
+# ---------------------- read caches ----------------------
+
+# path -> (generation, mtime_ns, deadline, entries)
+_DIR_CACHE = {}
+# path -> (mtime_ns, size, data)
+_JSON_CACHE = {}
+_JSON_CACHE_MAX = 2048
+_JSON_CACHE_LOCK = threading.Lock()
+_CACHE_GENERATION = 0
+
+
+def bump_cache_generation():
+    """Invalidate cached directory listings after a write."""
+    global _CACHE_GENERATION
+    _CACHE_GENERATION += 1
+
+
+def cache_generation() -> int:
+    """Current write generation; caches compare against it to detect writes."""
+    return _CACHE_GENERATION
+
+
+def cached_scandir(path, ttl=2.0):
+    """
+    os.scandir() with a short-lived cache; returns a tuple of DirEntry objects
+    (their is_dir()/is_file() answers come from the directory read, no extra stat).
+    Within `ttl` seconds the cached entries are returned without a syscall;
+    after that the directory mtime is re-checked and the listing is only
+    re-read if it changed. Raises like os.scandir if the path is missing.
+    """
+    now = time.monotonic()
+    hit = _DIR_CACHE.get(path)
+    if hit and hit[0] == _CACHE_GENERATION and now < hit[2]:
+        return hit[3]
+
+    mtime_ns = os.stat(path).st_mtime_ns
+    if hit and hit[0] == _CACHE_GENERATION and hit[1] == mtime_ns:
+        entries = hit[3]
+    else:
+        with os.scandir(path) as it:
+            entries = tuple(it)
+    _DIR_CACHE[path] = (_CACHE_GENERATION, mtime_ns, now + ttl, entries)
+    return entries
+
+
+def cached_listdir(path, ttl=2.0):
+    """os.listdir() counterpart of cached_scandir (entry names only)."""
+    return [e.name for e in cached_scandir(path, ttl)]
+
+
+def load_json_cached(file_path):
+    """
+    Like load_json_as_dict, but memoised on (mtime_ns, size) of the file.
+    The returned dict is shared between callers: treat it as read-only.
+    """
+    pending = _pending_json(file_path)
+    if pending is not None:
+        return pending
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return {}
+    hit = _JSON_CACHE.get(file_path)
+    if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+        return hit[2]
+
+    data = load_json_as_dict(file_path)
+    with _JSON_CACHE_LOCK:  # callers may read from a thread pool
+        if len(_JSON_CACHE) >= _JSON_CACHE_MAX:
+            _JSON_CACHE.pop(next(iter(_JSON_CACHE)))
+        _JSON_CACHE[file_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
 # ---------------------- child group expansion ----------------------
 
+# folder -> ((dir mtime_ns, newest option mtime_ns, option count), options)
+_CHILD_OPTIONS_CACHE = {}
+
+
+def _child_folder_options(folder_abs: str):
+    """
+    Lightweight loader used for child folders, including sibling images.
+    The parsed list is kept per folder until an option file or the folder listing
+    changes (added/removed files, images included, bump the folder mtime);
+    callers get fresh option dicts each time.
+    """
+    if not folder_abs:
+        return []
+    try:
+        dir_mtime = os.stat(folder_abs).st_mtime_ns
+        with os.scandir(folder_abs) as it:
+            files = sorted((e.name, e) for e in it
+                           if e.name.endswith(".json") and e.name != "_group.json")
+        newest = max((e.stat().st_mtime_ns for _, e in files), default=0)
+    except OSError:
+        return []
+
+    stamp = (dir_mtime, newest, len(files))
+    hit = _CHILD_OPTIONS_CACHE.get(folder_abs)
+    if hit and hit[0] == stamp:
+        return [dict(o) for o in hit[1]]
+
+    opts = []
+    images = image_urls(folder_abs)
+    for f, e in files:
+        data = load_json_as_dict(e.path) or {}
+
+        oid = (data.get("id") or os.path.splitext(f)[0]).strip()
+        if not oid:
+            continue
+
+        disp = (
+            data.get("display")
+            or data.get("label")
+            or data.get("name")
+            or data.get("properties", {}).get("name")
+            or oid.replace("_", " ").title()
+        )
+
+        opt = {"id": oid, "display": disp}
+
+        # description (prefer top-level, then properties.description)
+        desc = data.get("description") or data.get("properties", {}).get("description")
+        if desc:
+            opt["description"] = desc
+
+        # existing image fields (if present in JSON)
+        if data.get("image"):
+            opt["image"] = data["image"]
+        if data.get("image_url"):
+            opt["image_url"] = data["image_url"]
+
+        # NEW: attach sibling image file (oid + extension) if no image already set
+        if "image" not in opt and "image_url" not in opt:
+            img = images.get(oid)
+            if img:
+                opt["image"] = img
+
+        opts.append(opt)
+
+    # nice stable ordering
+    opts.sort(key=lambda o: ((o.get("display") or o.get("id") or "").lower(),
+                            (o.get("id") or "").lower()))
+    _CHILD_OPTIONS_CACHE[folder_abs] = (stamp, opts)
+    return [dict(o) for o in opts]
+
+
 def expand_child_groups(*, base_groups, current_type, label_base_path, existing_labels):
     """
     Expand nested child groups when a parent option is selected.
@@ -164,61 +554,6 @@ def expand_child_groups(*, base_groups, current_type, label_base_path, existing_
             return sel.get("label") or sel.get("id")
         return None
 
-    def _collect_folder_options(folder_abs: str):
-        """Lightweight loader used for child folders, including sibling images."""
-        if not folder_abs or not os.path.isdir(folder_abs):
-            return []
-
-        opts = []
-        for f in sorted(os.listdir(folder_abs)):
-            if not f.endswith(".json") or f == "_group.json":
-                continue
-
-            path = os.path.join(folder_abs, f)
-            data = load_json_as_dict(path) or {}
-
-            oid = (data.get("id") or os.path.splitext(f)[0]).strip()
-            if not oid:
-                continue
-
-            disp = (
-                data.get("display")
-                or data.get("label")
-                or data.get("name")
-                or data.get("properties", {}).get("name")
-                or oid.replace("_", " ").title()
-            )
-
-            opt = {"id": oid, "display": disp}
-
-            # description (prefer top-level, then properties.description)
-            desc = data.get("description") or data.get("properties", {}).get("description")
-            if desc:
-                opt["description"] = desc
-
-            # existing image fields (if present in JSON)
-            if data.get("image"):
-                opt["image"] = data["image"]
-            if data.get("image_url"):
-                opt["image_url"] = data["image_url"]
-
-            # NEW: attach sibling image file (oid + extension) if no image already set
-            if "image" not in opt and "image_url" not in opt:
-                for ext in (".png", ".jpg", ".jpeg", ".webp", ".gif"):
-                    img_path = os.path.join(folder_abs, oid + ext)
-                    if os.path.exists(img_path):
-                        rel = os.path.relpath(img_path, ".").replace("\\", "/")
-                        # ensure it’s a web path starting with '/'
-                        opt["image"] = "/" + rel if not rel.startswith("/") else rel
-                        break
-
-            opts.append(opt)
-
-        # nice stable ordering
-        opts.sort(key=lambda o: ((o.get("display") or o.get("id") or "").lower(),
-                                (o.get("id") or "").lower()))
-        return opts
-
     while queue:
         g = queue.pop(0)
         parent_key = (g.get("key") or "").strip()
@@ -272,7 +607,7 @@ def expand_child_groups(*, base_groups, current_type, label_base_path, existing_
         if child_key in seen_keys:
             continue
 
-        child_options = _collect_folder_options(child_folder)
+        child_options = _child_folder_options(child_folder)
         if not child_options:
             continue
 
@@ -503,7 +838,7 @@ def list_types():
     root = "types"
     if not os.path.isdir(root):
         return []
-    return sorted([d for d in os.listdir(root) if os.path.isdir(os.path.join(root, d))])
+    return sorted(e.name for e in cached_scandir(root) if e.is_dir())
 
 def sanitise_key(raw: str, fallback: str = "") -> str:
     key = (raw or "").strip().lower()
@@ -933,11 +1268,23 @@ def list_label_groups_for_type(type_name: str):
 
     return sorted(groups, key=lambda s: (s.count("/"), s))
 
+_LABEL_GROUPS_TTL = 5.0
+_LABEL_GROUPS_CACHE = {}  # "all" -> (generation, deadline, {type: groups})
+
 def build_label_groups_by_type():
-    out = {}
-    for t in list_types():
-        out[t] = list_label_groups_for_type(t)
-    return out
+    """
+    {type: list_label_groups_for_type(type)} for every type.
+    Memoised for a few seconds (it walks every labels/ tree); any JSON write
+    through utils invalidates it. Callers get fresh lists each time.
+    """
+    now = time.monotonic()
+    hit = _LABEL_GROUPS_CACHE.get("all")
+    if not (hit and hit[0] == _CACHE_GENERATION and now < hit[1]):
+        out = {}
+        for t in list_types():
+            out[t] = list_label_groups_for_type(t)
+        hit = _LABEL_GROUPS_CACHE["all"] = (_CACHE_GENERATION, now + _LABEL_GROUPS_TTL, out)
+    return {t: list(groups) for t, groups in hit[2].items()}
 
 def build_label_catalog_for_type(current_type: str, max_per_group: int = 200):
     """
@@ -1084,6 +1431,8 @@ def archive_type(type_name):
     os.makedirs(dst_root, exist_ok=True)
     dst = os.path.join(dst_root, archive_type_folder_name(type_name))
     shutil.move(src, dst)
+    forget_ensured_dirs()
+    bump_cache_generation()
     return dst
 
 def restore_type(archived_folder):
@@ -1100,6 +1449,8 @@ def restore_type(archived_folder):
         raise FileExistsError(f"Type '{type_name}' already exists live.")
     os.makedirs("types", exist_ok=True)
     shutil.move(src, dst)
+    forget_ensured_dirs()
+    bump_cache_generation()
     return dst
 
 def scan_cross_references(target_type: str):
@@ -1365,11 +1716,12 @@ def collect_label_groups(label_base_path: str, current_type: str):
             return None
         return {"kind": kind, "name": "value"}
 
+    # One directory read for both passes; DirEntry answers is_file()/is_dir() from it
+    with os.scandir(label_base_path) as it:
+        top_entries = list(it)
+
     # ---------- 1) Property‑JSON groups (top level files in labels/) ----------
-    top_level_jsons = [
-        f for f in os.listdir(label_base_path)
-        if f.endswith(".json") and os.path.isfile(os.path.join(label_base_path, f))
-    ]
+    top_level_jsons = {e.name for e in top_entries if e.name.endswith(".json") and e.is_file()}
 
     for jf in sorted(top_level_jsons):
         prop_key  = os.path.splitext(jf)[0]
@@ -1482,10 +1834,8 @@ def collect_label_groups(label_base_path: str, current_type: str):
         groups.append(g)
 
     # ---------- 2) Legacy folders (subdirectories without a matching property JSON) ----------
-    for entry in sorted(os.listdir(label_base_path)):
+    for entry in sorted(e.name for e in top_entries if e.is_dir()):
         full = os.path.join(label_base_path, entry)
-        if not os.path.isdir(full):
-            continue
         if f"{entry}.json" in top_level_jsons:
             # already represented by a property JSON
             continue
@@ -1605,6 +1955,7 @@ def _write_label_json(base_dir: str, label_type: str, item: dict):
 
     with open(path_json, "w") as f:
         json.dump(payload, f, indent=2)
+    bump_cache_generation()
 
     # child folders
     label_id = payload["id"]
@@ -1629,6 +1980,7 @@ def _ensure_property_self_labels(type_name: str, group_key: str, display_label:
                     "allow_children": True
                 }
             }, f, indent=2)
+        bump_cache_generation()
 import os, json, time, hashlib
 import requests
 from requests.adapters import HTTPAdapter
@@ -1850,6 +2202,8 @@ def _import_labels_from_api(
             # skip bad write but keep going
             continue
 
+    if written:
+        bump_cache_generation()
     return True, {"count": len(written), "written": written}
 
 def _import_labels_from_sqlite(type_name: str, group_key: str, display_label: str, description: str,